@@ -3,10 +3,8 @@ Main entry point for the PsychoChauffeur Telegram bot.
 Handles message processing, command registration, and bot initialization.
 """
 import asyncio
-import hashlib
 import ipaddress
 import logging
-import nest_asyncio
 import re
 import pyshorteners
 import random
@@ -14,24 +12,26 @@ import sys
 import telegram
 import os
 from datetime import datetime
-from typing import List, Optional, Dict
+from typing import Awaitable, List, Optional, Dict
 import time
 from collections import deque
+from functools import lru_cache
+from itertools import islice
 
 from telegram import Update
 from telegram.ext import (
-    ApplicationBuilder, CommandHandler, MessageHandler, filters,
+    Application, ApplicationBuilder, CommandHandler, MessageHandler, filters,
     CallbackContext, CallbackQueryHandler, ContextTypes
 )
 
-from modules.keyboards import create_link_keyboard, button_callback
+from modules.keyboards import create_link_keyboard, button_callback, get_link_hash
 from modules.utils import (
     ScreenshotManager, MessageCounter, remove_links, screenshot_command, cat_command,
     extract_urls, init_directories
 )
 from modules.const import (
     TOKEN, OPENAI_API_KEY, KYIV_TZ, ALIEXPRESS_STICKER_ID,
-    VideoPlatforms, LinkModification, Config
+    VideoPlatforms, LinkModification, Config, Stickers
 )
 from modules.gpt import ask_gpt_command, analyze_command, answer_from_gpt
 from modules.weather import WeatherCommandHandler
@@ -42,8 +42,6 @@ from modules.error_handler import handle_errors, ErrorHandler, ErrorCategory, Er
 from modules.geomagnetic import GeomagneticCommandHandler
 from modules.reminders.reminders import ReminderManager
 
-nest_asyncio.apply()
-
 # URL shortener cache and rate limiter
 _url_shortener_cache: Dict[str, str] = {}
 _shortener_calls: deque = deque()
@@ -69,6 +67,12 @@ keyboard_mapping = {
 }
 keyboard_mapping.update({k.upper(): v.upper() for k, v in keyboard_mapping.items()})
 
+# Precompiled trigger scanners: one linear pass per message instead of one substring scan per word
+_RESTRICTED_CHARS_RE = re.compile('[ЫыЪъЭэЁё]')
+_VIDEO_PLATFORM_RE = re.compile('|'.join(map(re.escape, VideoPlatforms.SUPPORTED_PLATFORMS)), re.IGNORECASE)
+_WORD_RE = re.compile(r'\S+')
+_ALIEXPRESS_RE = re.compile(r'(?:aliexpress|a\.aliexpress)\.(?:[a-z]{2,3})/(?:item/)?')
+
 @handle_errors(feedback_message="An error occurred in /start command.")
 async def start(update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
     welcome_text = (
@@ -108,25 +112,33 @@ def needs_gpt_response(update: Update, context: CallbackContext, message_text: s
     bot_username = context.bot.username
     is_private_chat = update.effective_chat.type == 'private'
     mentioned = f"@{bot_username}" in message_text
-    contains_video_platform = any(platform in message_text.lower() for platform in VideoPlatforms.SUPPORTED_PLATFORMS)
-    contains_modified_domain = any(domain in message_text for domain in LinkModification.DOMAINS)
+    contains_video_platform = _VIDEO_PLATFORM_RE.search(message_text) is not None
+    contains_modified_domain = LinkModification.ANY_PATTERN.search(message_text) is not None
     return (mentioned or (is_private_chat and not (contains_video_platform or contains_modified_domain)))
 
+@lru_cache(maxsize=1024)
+def _chat_log(chat_id: int, chat_title: str, username: Optional[str]) -> logging.LoggerAdapter:
+    """Return a chat_logger adapter carrying the per-chat fields the log formatters expect."""
+    return logging.LoggerAdapter(chat_logger, {'chat_id': chat_id, 'chattitle': chat_title, 'username': username})
+
 @handle_errors(feedback_message="An error occurred while processing your message.")
 async def handle_message(update: Update, context: CallbackContext) -> None:
     """Handle incoming text messages with standardized error handling."""
-    if not update.message or not update.message.text:
+    # Bind the attribute chains read below to locals once per message
+    message = update.message
+    if not message or not message.text:
         return
-    message_text = update.message.text
-    chat_id = update.message.chat_id
-    username = update.message.from_user.username
-    user_id = update.message.from_user.id
-    last_user_messages.setdefault(user_id, {'current': None, 'previous': None})
-    last_user_messages[user_id]['previous'] = last_user_messages[user_id]['current']
-    last_user_messages[user_id]['current'] = message_text
-    chat_title = update.effective_chat.title or "Private Chat"
-    chat_logger.info(f"User message: {message_text}", extra={'chat_id': chat_id, 'chattitle': chat_title, 'username': username})
-    if any(char in message_text for char in "ЫыЪъЭэЁё"):
+    message_text = message.text
+    chat_id = message.chat_id
+    user = message.from_user
+    username = user.username
+    user_id = user.id
+    history = last_user_messages.setdefault(user_id, {'current': None, 'previous': None})
+    history['previous'] = history['current']
+    history['current'] = message_text
+    chat_title = message.chat.title or "Private Chat"
+    _chat_log(chat_id, chat_title, username).info("User message: %s", message_text)
+    if _RESTRICTED_CHARS_RE.search(message_text):
         await restrict_user(update, context)
         return
     if "бля!" in message_text:
@@ -137,64 +149,92 @@ async def handle_message(update: Update, context: CallbackContext) -> None:
         logger.info(f"Processing URLs: {urls}")
         await process_urls(update, context, urls, message_text)
         return
+    # GPT round-trips take seconds; run them as application tasks so the handler returns promptly
     if needs_gpt_response(update, context, message_text):
         cleaned_message = message_text.replace(f"@{context.bot.username}", "").strip()
         logger.info(f"GPT response triggered for: {cleaned_message}")
-        await ask_gpt_command(cleaned_message, update, context)
+        context.application.create_task(
+            log_background_errors(ask_gpt_command(cleaned_message, update, context), "GPT response"),
+            update=update
+        )
         return
-    await handle_random_gpt_response(update, context)
+    # The counter check is cheap and rarely fires, so only the GPT call itself becomes a task
+    if random_gpt_response_due(message_text, chat_id):
+        context.application.create_task(
+            log_background_errors(handle_random_gpt_response(update, context), "random GPT response"),
+            update=update
+        )
 
-@handle_errors(feedback_message="An error occurred while processing GPT response.")
-async def handle_random_gpt_response(update: Update, context: CallbackContext) -> None:
-    """Handle random GPT responses based on message count with error handling."""
-    message_text = update.message.text
-    chat_id = update.message.chat_id
-    if not message_text or len(message_text.split()) < 5:
-        return
+async def log_background_errors(coro: Awaitable[None], description: str) -> None:
+    """Await a background coroutine, logging failures that would otherwise be lost with the task."""
+    try:
+        await coro
+    except Exception as e:
+        error_logger.error(f"Background {description} failed: {e}", exc_info=True)
+
+def random_gpt_response_due(message_text: str, chat_id: int) -> bool:
+    """Count a message towards the chat's random GPT reply and report whether one is due."""
+    # Stop scanning after the fifth word instead of splitting the whole message
+    if not message_text or sum(1 for _ in islice(_WORD_RE.finditer(message_text), 5)) < 5:
+        return False
     current_count = message_counter.increment(chat_id)
     if current_count > 50 and random.random() < 0.02:
         general_logger.info(
             f"Random GPT response triggered in chat {chat_id}: "
             f"Message count: {current_count}"
         )
-        await answer_from_gpt(message_text, update, context)
-        message_counter.reset(chat_id)
+        return True
+    return False
+
+@handle_errors(feedback_message="An error occurred while processing GPT response.")
+async def handle_random_gpt_response(update: Update, context: CallbackContext) -> None:
+    """Send the random GPT response that random_gpt_response_due() decided on."""
+    await answer_from_gpt(update.message.text, update, context)
+    message_counter.reset(update.message.chat_id)
 
 @handle_errors(feedback_message="An error occurred while processing your links.")
 async def process_urls(update: Update, context: CallbackContext, urls: List[str], message_text: str) -> None:
     """Process URLs for modification or video downloading with standardized error handling."""
-    modified_links = []
-    needs_video_download = any(platform in url.lower() for url in urls for platform in VideoPlatforms.SUPPORTED_PLATFORMS)
+    needs_video_download = any(_VIDEO_PLATFORM_RE.search(url) for url in urls)
     if needs_video_download:
         video_downloader = context.bot_data.get('video_downloader')
         if video_downloader and hasattr(video_downloader, 'handle_video_link'):
             logger.info(f"Attempting video download for URLs: {urls}")
-            await video_downloader.handle_video_link(update, context)
+            await video_downloader.handle_video_link(update, context, urls=urls)
         else:
             error = ErrorHandler.create_error(message="Video downloader not initialized properly", severity=ErrorSeverity.HIGH, category=ErrorCategory.RESOURCE, context={"urls": urls, "chat_id": update.effective_chat.id if update and update.effective_chat else None})
             await ErrorHandler.handle_error(error, update, context)
         return
+    # Shortener calls and sticker sends are independent round-trips; run them concurrently.
+    # Each pending entry is (shorten coroutine, link to fall back to, suffix appended to the result).
+    pending = []
+    sticker_sends = []
     for url in urls:
         sanitized_link = sanitize_url(url)
-        if re.search(r'(?:aliexpress|a\.aliexpress)\.(?:[a-z]{2,3})/(?:item/)?', sanitized_link):
-            modified_link = await shorten_url(sanitized_link)
-            modified_links.append(f"{modified_link} #aliexpress")
-            await context.bot.send_sticker(chat_id=update.effective_chat.id, sticker=ALIEXPRESS_STICKER_ID)
+        if _ALIEXPRESS_RE.search(sanitized_link):
+            pending.append((shorten_url(sanitized_link), sanitized_link, " #aliexpress"))
+            sticker_sends.append(context.bot.send_sticker(chat_id=update.effective_chat.id, sticker=ALIEXPRESS_STICKER_ID))
         else:
-            processed = False
-            for domain, modified_domain in LinkModification.DOMAINS.items():
-                if domain in sanitized_link and modified_domain not in sanitized_link:
-                    modified_link = sanitized_link.replace(domain, modified_domain)
-                    modified_links.append(await shorten_url(modified_link))
-                    processed = True
-                    break
-                elif modified_domain in sanitized_link:
-                    modified_links.append(await shorten_url(sanitized_link))
-                    processed = True
-                    break
+            modified_link, replaced = LinkModification.SOURCE_PATTERN.subn(lambda m: LinkModification.DOMAINS[m.group(0)], sanitized_link, count=1)
+            if replaced:
+                pending.append((shorten_url(modified_link), modified_link, ""))
+            elif LinkModification.TARGET_PATTERN.search(sanitized_link):
+                pending.append((shorten_url(sanitized_link), sanitized_link, ""))
             # If original URL is very long, shorten the sanitized link
-            if not processed and len(url) > 110:
-                modified_links.append(await shorten_url(sanitized_link))
+            elif len(url) > 110:
+                pending.append((shorten_url(sanitized_link), sanitized_link, ""))
+    # gather preserves order, so shortened links line up with their suffixes; one failed
+    # round-trip must not discard the rest, so failures come back as results
+    results = await asyncio.gather(*(coro for coro, _, _ in pending), *sticker_sends, return_exceptions=True)
+    for result in results[len(pending):]:
+        if isinstance(result, BaseException):
+            error_logger.error(f"Failed to send AliExpress sticker: {result}")
+    modified_links = []
+    for result, (_, fallback, suffix) in zip(results, pending):
+        if isinstance(result, BaseException):
+            error_logger.error(f"Failed to shorten URL {fallback}: {result}")
+            result = fallback
+        modified_links.append(f"{result}{suffix}")
     if modified_links:
         cleaned_message_text = remove_links(message_text).strip()
         await construct_and_send_message(update.effective_chat.id, update.message.from_user.username, cleaned_message_text, modified_links, update, context)
@@ -246,11 +286,12 @@ async def shorten_url(url: str) -> str:
     if len(_shortener_calls) >= _SHORTENER_MAX_CALLS_PER_MINUTE:
         general_logger.warning(f"URL shortener rate limit reached; skipping shorten for {url}")
         return url
+    # Record the call before awaiting so concurrent shortens can't overshoot the limit
+    _shortener_calls.append(now)
     try:
-        shortened = pyshorteners.Shortener().tinyurl.short(url)
-        # Cache and record call
+        # pyshorteners uses blocking requests; run it in a worker thread to keep the event loop free
+        shortened = await asyncio.to_thread(pyshorteners.Shortener().tinyurl.short, url)
         _url_shortener_cache[url] = shortened
-        _shortener_calls.append(now)
         general_logger.info(f"Shortened URL: {url} -> {shortened}")
         return shortened
     except Exception as e:
@@ -270,7 +311,7 @@ async def construct_and_send_message(chat_id: int, username: str, cleaned_messag
     try:
         modified_message = " ".join(modified_links)
         final_message = f"@{username}💬: {cleaned_message_text}\nWants to share: {modified_message}"
-        link_hash = hashlib.md5(modified_links[0].encode()).hexdigest()[:8]
+        link_hash = get_link_hash(modified_links[0])
         context.bot_data[link_hash] = modified_links[0]
         keyboard = create_link_keyboard(modified_links[0])
         await context.bot.send_message(chat_id=chat_id, text=final_message, reply_markup=keyboard, reply_to_message_id=(update.message.reply_to_message.message_id if update.message.reply_to_message else None))
@@ -285,11 +326,46 @@ async def handle_sticker(update: Update, context: CallbackContext) -> None:
     sticker_id = update.message.sticker.file_unique_id
     username = update.message.from_user.username
     general_logger.info(f"Received sticker with file_unique_id: {sticker_id}")
-    if sticker_id == "AgAD6BQAAh-z-FM":
+    if sticker_id == Stickers.RESTRICT_TRIGGER_UNIQUE_ID:
         logging.info(f"Matched specific sticker from {username}, restricting user.")
         await restrict_user(update, context)
 
-async def main() -> None:
+async def ping(update: Update, context: CallbackContext) -> None:
+    """Reply so admins can check the bot is alive."""
+    await update.message.reply_text("🏓 Bot is online!")
+
+# Handlers that hold no per-instance state; stateful command objects are created in main()
+_STATIC_HANDLERS = (
+    CommandHandler('start', start),
+    CommandHandler('cat', cat_command),
+    CommandHandler('gpt', ask_gpt_command),
+    CommandHandler('analyze', analyze_command),
+    CommandHandler('flares', screenshot_command),
+    CommandHandler('ping', ping),
+    CommandHandler('remind', reminder_manager.remind),
+    MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message),
+    MessageHandler(filters.Sticker.ALL, handle_sticker),
+    CallbackQueryHandler(button_callback),
+)
+
+async def post_init(application: Application) -> None:
+    """Finish startup that needs the running event loop owned by run_polling."""
+    await init_error_handler(application, Config.ERROR_CHANNEL_ID)
+    error_logger.error("Test notification message - If you see this in the Telegram channel, error logging is working!")
+    screenshot_manager = ScreenshotManager()
+    asyncio.create_task(screenshot_manager.schedule_task())
+    reminder_manager.schedule_startup(application.job_queue)
+
+async def post_shutdown(application: Application) -> None:
+    """Release pooled HTTP connections and flush error analytics once polling has stopped."""
+    weather_api = application.bot_data.get('weather_api')
+    if weather_api is not None:
+        await weather_api.aclose()
+    # The analytics writer coalesces saves; persist whatever it has not written yet
+    from modules.error_analytics import error_tracker
+    await asyncio.to_thread(error_tracker.flush)
+
+def main() -> None:
     """Initialize and run the bot."""
     # Validate required environment variables
     if not TOKEN:
@@ -298,48 +374,41 @@ async def main() -> None:
     if not OPENAI_API_KEY:
         logger.critical("OPENAI_API_KEY is not set. Exiting.")
         sys.exit(1)
+    # uvloop is optional (no Windows builds); run_polling picks up the policy via get_event_loop()
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+        logger.info("Using uvloop event loop")
+    except ImportError:
+        logger.info("uvloop not installed, using the default asyncio event loop")
     try:
         init_directories()
-        application = ApplicationBuilder().token(TOKEN).build()
+        application = ApplicationBuilder().token(TOKEN).post_init(post_init).post_shutdown(post_shutdown).build()
         from modules.error_analytics import error_report_command
-        commands = {
-            'start': start,
-            'cat': cat_command,
-            'gpt': ask_gpt_command,
-            'analyze': analyze_command,
-            'flares': screenshot_command,
-            'weather': WeatherCommandHandler(),
-            'errors': error_report_command,
-            'gm': GeomagneticCommandHandler(),
-            'ping': lambda update, context: update.message.reply_text("🏓 Bot is online!"),
-            'remind': reminder_manager.remind
-        }
-        for command, handler in commands.items():
-            application.add_handler(CommandHandler(command, handler))
-
-        application.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
-        application.add_handler(MessageHandler(filters.Sticker.ALL, handle_sticker))
-        application.add_handler(CallbackQueryHandler(button_callback))
+        weather_handler = WeatherCommandHandler()
+        application.bot_data['weather_api'] = weather_handler.weather_api
+        application.add_handlers([
+            *_STATIC_HANDLERS,
+            CommandHandler('weather', weather_handler),
+            CommandHandler('gm', GeomagneticCommandHandler()),
+            CommandHandler('errors', error_report_command),
+        ])
         video_downloader = setup_video_handlers(application, extract_urls_func=extract_urls)
         application.bot_data['video_downloader'] = video_downloader
-        await init_error_handler(application, Config.ERROR_CHANNEL_ID)
-        error_logger.error("Test notification message - If you see this in the Telegram channel, error logging is working!")
-        screenshot_manager = ScreenshotManager()
-        asyncio.create_task(screenshot_manager.schedule_task())
-        reminder_manager.schedule_startup(application.job_queue)
         logger.info("Bot is starting...")
-        await application.run_polling()
+        # run_polling owns the event loop; async startup happens in post_init.
+        # Long-poll at Telegram's max timeout and only subscribe to the update types we handle
+        # (stickers arrive as messages)
+        application.run_polling(
+            timeout=50,
+            poll_interval=0.0,
+            allowed_updates=[Update.MESSAGE, Update.CALLBACK_QUERY]
+        )
     except Exception as e:
-        standard_error = ErrorHandler.create_error(message="Bot failed to start", severity=ErrorSeverity.CRITICAL, category=ErrorCategory.GENERAL, context={"system_info": {"python_version": sys.version, "event_loop": str(asyncio.get_event_loop())}, "time": datetime.now(KYIV_TZ).isoformat()}, original_exception=e)
+        standard_error = ErrorHandler.create_error(message="Bot failed to start", severity=ErrorSeverity.CRITICAL, category=ErrorCategory.GENERAL, context={"system_info": {"python_version": sys.version}, "time": datetime.now(KYIV_TZ).isoformat()}, original_exception=e)
         error_message = ErrorHandler.format_error_message(standard_error, prefix="💥")
         error_logger.critical(error_message)
         raise
 
 if __name__ == '__main__':
-    try:
-        asyncio.run(main())
-    except RuntimeError as e:
-        if "Cannot close a running event loop" in str(e):
-            error_logger.error("Event loop is already running. Please check your environment.")
-        else:
-            raise
\ No newline at end of file
+    main()
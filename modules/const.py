@@ -2,7 +2,8 @@
 Constants and configuration settings for the PsychoChauffeur bot.
 """
 import os
-from typing import Dict
+import re
+from typing import Dict, Pattern
 from dotenv import load_dotenv
 import pytz
 
@@ -30,6 +31,8 @@ class Config:
 class Stickers:
     """Telegram sticker IDs."""
     ALIEXPRESS: str = 'CAACAgQAAxkBAAEuNplnAqatdmo-G7S_065k9AXXnqUn4QACwhQAAlKL8FNCof7bbA2jAjYE'
+    # file_unique_id of the sticker that gets its sender restricted
+    RESTRICT_TRIGGER_UNIQUE_ID: str = 'AgAD6BQAAh-z-FM'
 
 class LinkModification:
     """Domain modifications for various social media platforms."""
@@ -38,6 +41,15 @@ class LinkModification:
         "x.com": "fixupx.com",
         "instagram.com": "ddinstagram.com"
     }
+    # Precompiled matchers over whole host labels, so e.g. fixupx.com never matches x.com
+    SOURCE_PATTERN: Pattern[str] = re.compile(
+        r'(?<![\w-])(?:' + '|'.join(map(re.escape, DOMAINS)) + r')\b'
+    )
+    TARGET_PATTERN: Pattern[str] = re.compile(
+        r'(?<![\w-])(?:' + '|'.join(map(re.escape, DOMAINS.values())) + r')\b'
+    )
+    # Any source or target domain as a plain substring, for cheap message-level checks
+    ANY_PATTERN: Pattern[str] = re.compile('|'.join(map(re.escape, sorted(DOMAINS.keys() | DOMAINS.values()))))
 
 class VideoPlatforms:
     """Supported video platforms."""
@@ -50,11 +62,10 @@ class VideoPlatforms:
 class Weather:
     """Weather-related configurations and mappings."""
     # City name translations (Ukrainian -> English)
+    # Keys are casefolded with whitespace removed, matching get_city_translation's lookup
     CITY_TRANSLATIONS: Dict[str, str] = {
         "кортгене": "Kortgene",
-        "тель авів": "Tel Aviv",
         "тельавів": "Tel Aviv",
-        "Тель Авів": "Tel Aviv",
     }
     
     CONDITION_EMOJIS: Dict[range, str] = {
@@ -14,21 +14,29 @@ import pytz
 import asyncio
 from collections import defaultdict
 import logging
-from threading import Lock
+from threading import RLock
 
 # Import from our error handling system
 from modules.error_handler import StandardError, ErrorCategory, ErrorSeverity
-from modules.logger import KYIV_TZ
+from modules.const import KYIV_TZ
 
 # Constants
 ANALYTICS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'logs', 'analytics')
 ERROR_STATS_FILE = os.path.join(ANALYTICS_DIR, 'error_stats.json')
 ERROR_HISTORY_FILE = os.path.join(ANALYTICS_DIR, 'error_history.json')
 MAX_HISTORY_ENTRIES = 1000  # Maximum number of error entries to store
+SAVE_COALESCE_SECONDS = 2.0  # Minimum delay between two flushes to disk
 
 # Initialize logger
 analytics_logger = logging.getLogger('analytics_logger')
 
+def _write_json_atomic(path: str, data: Any) -> None:
+    """Write JSON to a temporary file and swap it in, so readers never see a partial file."""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, path)
+
 class ErrorTracker:
     """
     Track and analyze errors for system diagnostics and improvement.
@@ -48,7 +56,9 @@ class ErrorTracker:
             "last_updated": datetime.now(KYIV_TZ).isoformat()
         }
         self.error_history: List[Dict[str, Any]] = []
-        self.lock = Lock()
+        # Re-entrant: clear_stats() calls _save_data() while already holding the lock
+        self.lock = RLock()
+        self._dirty = asyncio.Event()
         
         # Ensure directories exist
         os.makedirs(ANALYTICS_DIR, exist_ok=True)
@@ -96,11 +106,13 @@ class ErrorTracker:
             analytics_logger.error(f"Failed to schedule analytics tasks: {str(e)}")
     
     async def _periodic_save(self) -> None:
-        """Periodically save error stats and history."""
+        """Flush error stats and history whenever they change, coalescing bursts."""
         while True:
             try:
-                await asyncio.sleep(300)  # Save every 5 minutes
-                self._save_data()
+                await self._dirty.wait()
+                self._dirty.clear()
+                await asyncio.to_thread(self._save_data)
+                await asyncio.sleep(SAVE_COALESCE_SECONDS)
             except Exception as e:
                 analytics_logger.error(f"Error in periodic save: {str(e)}")
                 await asyncio.sleep(60)  # Retry after a minute if there's an error
@@ -123,17 +135,20 @@ class ErrorTracker:
                 self.stats["last_updated"] = datetime.now(KYIV_TZ).isoformat()
                 
                 # Save stats
-                with open(ERROR_STATS_FILE, 'w') as f:
-                    json.dump(self.stats, f, indent=2)
+                _write_json_atomic(ERROR_STATS_FILE, self.stats)
                 
                 # Save limited history (most recent entries)
-                with open(ERROR_HISTORY_FILE, 'w') as f:
-                    json.dump(self.error_history[-MAX_HISTORY_ENTRIES:], f, indent=2)
+                _write_json_atomic(ERROR_HISTORY_FILE, self.error_history[-MAX_HISTORY_ENTRIES:])
                     
                 analytics_logger.info("Error analytics data saved successfully")
             except Exception as e:
                 analytics_logger.error(f"Failed to save error analytics data: {str(e)}")
     
+    def flush(self) -> None:
+        """Write pending changes to disk now, e.g. at shutdown before the writer task is cancelled."""
+        self._dirty.clear()
+        self._save_data()
+
     def track_error(self, error: StandardError) -> None:
         """
         Track an error and update statistics.
@@ -188,6 +203,9 @@ class ErrorTracker:
                 # Update last updated timestamp
                 self.stats["last_updated"] = now.isoformat()
                 
+                # Let the background writer pick the change up
+                self._dirty.set()
+                
             except Exception as e:
                 analytics_logger.error(f"Error tracking error: {str(e)}")
     
@@ -3,14 +3,11 @@ import traceback
 from enum import Enum
 from typing import Dict, Optional, Any, Type, Callable, Awaitable, Union, List
 from datetime import datetime
-import pytz
 from telegram import Update
 from telegram.ext import ContextTypes
+from modules.const import KYIV_TZ
 from modules.logger import error_logger
 
-# Timezone constants
-KYIV_TZ = pytz.timezone("Europe/Kyiv")
-
 
 class ErrorSeverity(Enum):
     """Error severity levels for categorizing errors"""
@@ -1,14 +1,13 @@
 import os
 import csv
 import logging
-from logging.handlers import RotatingFileHandler
 import threading
 from typing import Set, Optional, Dict, List
 from datetime import datetime
-import pytz
-from pathlib import Path
 import sys
 
+logger = logging.getLogger(__name__)
+
 # Constants
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
@@ -16,38 +15,6 @@ LOG_DIR = os.path.join(PROJECT_ROOT, 'logs')
 ANALYTICS_DIR = os.path.join(LOG_DIR, 'analytics')
 CSV_FILE = os.path.join(DATA_DIR, "user_locations.csv")
 # (deprecated: used_words.csv removed)
-KYIV_TZ = pytz.timezone('Europe/Kyiv')
-
-
-# Ensure directories exist
-def ensure_directories():
-    """Ensure all required directories exist with proper permissions."""
-    try:
-        os.makedirs(LOG_DIR, exist_ok=True)
-        os.makedirs(DATA_DIR, exist_ok=True)
-        os.makedirs(ANALYTICS_DIR, exist_ok=True)
-        
-        # Verify write permissions
-        test_log_path = os.path.join(LOG_DIR, 'test.log')
-        with open(test_log_path, 'w') as f:
-            f.write('Test log write\n')
-        os.remove(test_log_path)
-        logging.getLogger(__name__).info("Write permission verified for log directory")
-        return True
-    except Exception as e:
-        logging.getLogger(__name__).error(f"Error setting up directories: {e}")
-        return False
-
-# Custom formatter for Kyiv timezone
-class KyivTimezoneFormatter(logging.Formatter):
-    """Custom formatter that uses Kyiv timezone"""
-    def formatTime(self, record, datefmt=None):
-        dt = datetime.fromtimestamp(record.created).astimezone(KYIV_TZ)
-        return dt.strftime(datefmt) if datefmt else dt.strftime("%Y-%m-%d %H:%M:%S %z")
-
-
-# Telegram error reporting handler
-
 
 
 # CSV file management
@@ -68,7 +35,7 @@ def ensure_csv_headers(file_path: str, headers: List[str]) -> None:
         with open(file_path, mode='w', newline='', encoding='utf-8') as f:
             writer = csv.writer(f)
             writer.writerow(headers)
-        logging.getLogger(__name__).info(
+        logger.info(
             f"Created new CSV file with headers: {file_path}"
         )
         return
@@ -90,11 +57,91 @@ def ensure_csv_headers(file_path: str, headers: List[str]) -> None:
                     writer = csv.writer(wf)
                     writer.writerow(headers)
                     writer.writerows(all_data)
-        logging.getLogger(__name__).info(f"Added or corrected headers in CSV file: {file_path}")
+        logger.info(f"Added or corrected headers in CSV file: {file_path}")
     except Exception as e:
-        logging.getLogger(__name__).error(f"Error checking CSV headers: {e}")
+        logger.error(f"Error checking CSV headers: {e}")
 
 # Data management functions
+LOCATION_HEADERS = ["user_id", "city", "timestamp", "chat_id"]
+LOCATION_COMPACT_SLACK = 100  # Superseded rows tolerated before the CSV is rewritten
+
+
+class _LocationIndex:
+    """In-memory view of a user locations CSV.
+
+    The CSV is append-only: the last row for a (user_id, chat_id) pair wins. The
+    index is reloaded only when the file changes behind our back, and the file is
+    compacted once superseded rows pile up.
+    """
+    def __init__(self, path: str):
+        self.path = path
+        self.fieldnames: List[str] = list(LOCATION_HEADERS)
+        self.entries: Dict[tuple, Dict[str, str]] = {}
+        self.row_count = 0
+        self.signature: Optional[tuple] = None
+
+    def _stat_signature(self) -> Optional[tuple]:
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return (st.st_mtime_ns, st.st_size)
+
+    def refresh(self) -> None:
+        """Reload the index if the file was created or modified externally."""
+        if self.signature is not None and self._stat_signature() == self.signature:
+            return
+        ensure_csv_headers(self.path, LOCATION_HEADERS)
+        self.entries.clear()
+        self.row_count = 0
+        with open(self.path, mode='r', newline='', encoding='utf-8') as f:
+            reader = csv.DictReader(f)
+            self.fieldnames = list(reader.fieldnames or LOCATION_HEADERS)
+            for row in reader:
+                self._add(row)
+        self.signature = self._stat_signature()
+
+    def _add(self, row: Dict[str, str]) -> None:
+        self.entries[(row.get('user_id') or '', row.get('chat_id') or '')] = row
+        self.row_count += 1
+
+    def append(self, row: Dict[str, str]) -> None:
+        """Append a row to the CSV and the index."""
+        with open(self.path, mode='a', newline='', encoding='utf-8') as f:
+            csv.DictWriter(f, fieldnames=self.fieldnames).writerow(row)
+        self._add(row)
+        if self.row_count > 2 * len(self.entries) + LOCATION_COMPACT_SLACK:
+            self.compact()
+        self.signature = self._stat_signature()
+
+    def compact(self) -> None:
+        """Rewrite the CSV with only the latest row per key."""
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, mode='w', newline='', encoding='utf-8') as f:
+            writer = csv.DictWriter(f, fieldnames=self.fieldnames)
+            writer.writeheader()
+            writer.writerows(self.entries.values())
+        os.replace(tmp_path, self.path)
+        self.row_count = len(self.entries)
+
+    def get_city(self, user_id: str, chat_id: str = '') -> Optional[str]:
+        row = self.entries.get((user_id, chat_id))
+        return row.get('city') if row else None
+
+
+_location_indexes: Dict[str, _LocationIndex] = {}
+_location_lock = threading.Lock()
+
+
+def _get_location_index(file_path: str) -> _LocationIndex:
+    """Return the up-to-date index for file_path (call with _location_lock held)."""
+    index = _location_indexes.get(file_path)
+    if index is None:
+        index = _location_indexes[file_path] = _LocationIndex(file_path)
+    index.refresh()
+    return index
+
+
 def save_user_location(user_id, city, chat_id=None):
     """Save user's location to a CSV file.
     
@@ -103,91 +150,39 @@ def save_user_location(user_id, city, chat_id=None):
         city (str): City name
         chat_id (int, optional): Chat ID for group-specific cities
     """
-    # Use the constant instead of hardcoded path
-    file_path = CSV_FILE
-    
     # Always use "Kyiv" instead of "kiev"
     if city and city.lower() == "kiev":
         city = "Kyiv"
     
-    # Ensure CSV file has proper headers
-    ensure_csv_headers(file_path, ["user_id", "city", "timestamp", "chat_id"])
-    
-    # Read existing data first
-    existing_data = []
-    try:
-        with open(file_path, mode='r', newline='', encoding='utf-8') as f:
-            reader = csv.reader(f)
-            headers = next(reader, None)  # Skip header row
-            existing_data = list(reader)
-    except FileNotFoundError:
-        headers = ["user_id", "city", "timestamp", "chat_id"]
-        existing_data = []
-    
-    # Update or add new entry
-    timestamp = datetime.now().isoformat()
-    updated = False
-    
-    for i, row in enumerate(existing_data):
-        # Check if we're updating a chat-specific entry
-        if chat_id and len(row) >= 4:
-            if row[0] == str(user_id) and row[3] == str(chat_id):
-                existing_data[i] = [str(user_id), city, timestamp, str(chat_id)]
-                updated = True
-                break
-        # Or a user-specific entry (no chat_id provided)
-        elif not chat_id and (len(row) < 4 or not row[3]):
-            if row[0] == str(user_id):
-                # Preserve or update row based on length
-                if len(row) >= 4:
-                    existing_data[i] = [str(user_id), city, timestamp, row[3]]
-                else:
-                    existing_data[i] = [str(user_id), city, timestamp, ""]
-                updated = True
-                break
-    
-    if not updated:
-        # Add the new entry with appropriate chat_id
-        entry = [str(user_id), city, timestamp, str(chat_id) if chat_id else ""]
-        existing_data.append(entry)
-    
-    # Write back to file with headers
-    with open(file_path, mode='w', newline='', encoding='utf-8') as f:
-        writer = csv.writer(f)
-        writer.writerow(headers)  # Write headers first
-        writer.writerows(existing_data)
+    row = {
+        "user_id": str(user_id),
+        "city": city,
+        "timestamp": datetime.now().isoformat(),
+        "chat_id": str(chat_id) if chat_id else "",
+    }
+    with _location_lock:
+        # Use the constant instead of hardcoded path
+        _get_location_index(CSV_FILE).append(row)
     
 def get_last_used_city(user_id: int, chat_id: Optional[int] = None) -> Optional[str]:
     """
     Retrieve the last city set by a user, preferring chat-specific entry.
     Returns None if no city is found.
     """
-    headers = ["user_id", "city", "timestamp", "chat_id"]
     # Use CSV_FILE for data storage
     file_path = CSV_FILE
-    # Ensure CSV file and headers exist
-    ensure_csv_headers(file_path, headers)
     try:
-        with open(file_path, mode='r', newline='', encoding='utf-8') as f:
-            reader = csv.DictReader(f)
+        with _location_lock:
+            index = _get_location_index(file_path)
             # First, look for a chat-specific entry
-            if chat_id is not None:
-                for row in reader:
-                    if row.get('user_id') == str(user_id) and row.get('chat_id') == str(chat_id):
-                        city = row.get('city')
-                        if city:
-                            return 'Kyiv' if city.lower() == 'kiev' else city
-                # rewind reader to search default
-                f.seek(0)
-                next(reader, None)
+            city = index.get_city(str(user_id), str(chat_id)) if chat_id is not None else None
             # Next, look for a user default entry
-            for row in reader:
-                if row.get('user_id') == str(user_id) and not row.get('chat_id'):
-                    city = row.get('city')
-                    if city:
-                        return 'Kyiv' if city.lower() == 'kiev' else city
+            if not city:
+                city = index.get_city(str(user_id))
+        if city:
+            return 'Kyiv' if city.lower() == 'kiev' else city
     except FileNotFoundError:
-        logging.getLogger(__name__).warning(f"City data file not found: {file_path}")
+        logger.warning(f"City data file not found: {file_path}")
     except Exception as e:
-        logging.getLogger(__name__).error(f"Error reading city data: {e}")
+        logger.error(f"Error reading city data: {e}")
     return None
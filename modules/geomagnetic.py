@@ -11,6 +11,7 @@ import pytz
 
 from modules.logger import general_logger, error_logger
 from modules.const import KYIV_TZ
+from modules.utils import escape_markdown_v2
 from modules.error_handler import ErrorHandler, ErrorCategory, ErrorSeverity, handle_errors
 
 # Define URL constants
@@ -31,15 +32,6 @@ class GeomagneticData:
         if not self.current_value or not self.current_description:
             return "Не вдалося отримати дані про геомагнітну активність\\."
         
-        # Define special characters that need escaping for Markdown V2
-        special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-        
-        def escape_text(text: str) -> str:
-            """Helper function to escape special characters."""
-            for char in special_chars:
-                text = text.replace(char, f"\\{char}")
-            return text
-        
         # Calculate activity level
         def get_activity_level(value: int) -> str:
             if value <= 4:
@@ -80,12 +72,12 @@ class GeomagneticData:
         # Format the current geomagnetic state with averages
         message = [
             "🧲 Геомагнітна активність у Києві:",
-            f"Поточний стан: {self.current_value} \\- {escape_text(self.current_description)}",
-            f"Середнє сьогодні: {today_avg} \\- {escape_text(get_activity_level(today_avg))}",
+            f"Поточний стан: {self.current_value} \\- {escape_markdown_v2(self.current_description)}",
+            f"Середнє сьогодні: {today_avg} \\- {escape_markdown_v2(get_activity_level(today_avg))}",
         ]
         
         if tomorrow_avg > 0:
-            message.append(f"Середнє завтра: {tomorrow_avg} \\- {escape_text(get_activity_level(tomorrow_avg))}")
+            message.append(f"Середнє завтра: {tomorrow_avg} \\- {escape_markdown_v2(get_activity_level(tomorrow_avg))}")
         
         message.append("")
         
@@ -93,14 +85,14 @@ class GeomagneticData:
         if dates:
             message.append("📅 Детальний прогноз:")
             for date, items in dates.items():
-                message.append(f"\n{escape_text(date)}:")
+                message.append(f"\n{escape_markdown_v2(date)}:")
                 # Track previous activity levels
                 last_activity_level = None
                 
                 for item in items:
-                    time = escape_text(item.get('time', ''))
+                    time = escape_markdown_v2(item.get('time', ''))
                     value = item.get('value', '')
-                    description = escape_text(self.legend.get(str(value), ""))
+                    description = escape_markdown_v2(self.legend.get(str(value), ""))
                     activity_level = get_activity_level(value)
                     
                     # Only add indicator for past items
@@ -111,14 +103,14 @@ class GeomagneticData:
                     # Only show activity level if it changed or is the first occurrence
                     display_activity = ""
                     if activity_level != last_activity_level:
-                        display_activity = escape_text(activity_level)
+                        display_activity = escape_markdown_v2(activity_level)
                         last_activity_level = activity_level
                         
                     message.append(f"  {time}: {value} \\- {description} {display_activity} {indicator}")
         
         # Add last updated time
         timestamp = self.timestamp.strftime('%H:%M %d.%m.%Y')
-        message.append(f"\nОновлено: {escape_text(timestamp)}")
+        message.append(f"\nОновлено: {escape_markdown_v2(timestamp)}")
         
         # Add source with properly escaped URL
         source_url = "https://meteofor\\.com\\.ua/weather\\-kyiv\\-4944/gm/"
@@ -1,11 +1,11 @@
 import openai
+import asyncio
 import logging
 import os
 from datetime import datetime, timedelta
-import pytz
-from typing import Optional
-from modules.logger import general_logger, error_logger, get_daily_log_path
-from modules.const import OPENAI_API_KEY
+from typing import List, Optional
+from modules.logger import general_logger, error_logger, get_daily_log_path, read_last_n_lines
+from modules.const import OPENAI_API_KEY, KYIV_TZ
 if os.getenv("USE_EMPTY_PROMPTS", "false").lower() == "true":
     from modules.prompts_empty import GPT_PROMPTS  # Use empty prompts in GitHub Actions
 else:
@@ -16,9 +16,20 @@ from telegram.ext import CallbackContext, ContextTypes
 from openai import AsyncClient
 
 
-client = AsyncClient(api_key=OPENAI_API_KEY)
+_client: Optional[AsyncClient] = None
+
+
+def get_client() -> AsyncClient:
+    """Return the shared OpenAI client, creating it on first use.
+
+    Building the client sets up an HTTP/TLS stack, so importing this module
+    (weather, main) should not pay for it until a GPT call is actually made.
+    """
+    global _client
+    if _client is None:
+        _client = AsyncClient(api_key=OPENAI_API_KEY)
+    return _client
 
-KYIV_TZ = pytz.timezone('Europe/Kiev')
 
 # (deprecated) GAME_STATE_FILE removed
 
@@ -32,13 +43,13 @@ async def gpt_response(prompt: str, update: Update = None, context: CallbackCont
             chat_id = update.effective_chat.id
             log_path = get_daily_log_path(chat_id)
             if os.path.exists(log_path):
-                with open(log_path, 'r', encoding='utf-8') as f:
-                    last_messages = f.readlines()[-3:]
+                # Tail the chat log off the event loop
+                last_messages = await asyncio.to_thread(read_last_n_lines, log_path, 3)
 
         context_prompt = ' '.join(last_messages)
         full_prompt = context_prompt + prompt
 
-        response = await client.chat.completions.create(
+        response = await get_client().chat.completions.create(
             model="gpt-4.1",
             messages=[
                 {"role": "system", "content": GPT_PROMPTS["gpt_response"] if not return_text else GPT_PROMPTS["gpt_response_return_text"]},
@@ -105,7 +116,7 @@ async def gpt_summary_function(messages):
         prompt = f"Підсумуйте наступні повідомлення:\n\n{messages_text}\n\nПідсумок:"
 
         # Call the OpenAI API to get the summary
-        response = await client.chat.completions.create(
+        response = await get_client().chat.completions.create(
             model="gpt-4.1",
             messages=[
                 {"role": "system", "content": GPT_PROMPTS["gpt_summary"]},
@@ -132,10 +143,25 @@ async def summarize_messages(messages):
         error_logger.error(f"Error summarizing messages: {e}")
         return "Could not generate summary."
 
+def read_log_messages(log_path: str) -> List[str]:
+    """Extract message texts from a daily chat log (blocking; run it in a worker thread)."""
+    messages_text = []
+    with open(log_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            # Split up to 6 times, message is last; messages may contain " - " themselves,
+            # so splitting from the right (rpartition) would cut them short
+            parts = line.strip().split(" - ", 6)
+            if len(parts) == 7:
+                messages_text.append(parts[6])
+            else:
+                general_logger.debug("Partial log line: %s", line)
+                if len(parts) > 3:  # At least timestamp, name, level, and some content
+                    messages_text.append(" ".join(parts[3:]))  # Take whatever’s after level
+    return messages_text
+
 async def analyze_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
     chat_id = str(update.effective_chat.id)
-    kyiv_tz = pytz.timezone('Europe/Kyiv')
-    target_date = datetime.now(kyiv_tz)
+    target_date = datetime.now(KYIV_TZ)
     date_str = "сьогодні"
 
     if context.args and context.args[0].lower() == "yesterday":
@@ -147,16 +173,7 @@ async def analyze_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await context.bot.send_message(chat_id, f"Немає повідомлень для аналізу за {date_str}.")
         return
 
-    messages_text = []
-    with open(log_path, 'r', encoding='utf-8') as f:
-        for line in f:
-            parts = line.strip().split(" - ", 6)  # Split up to 6 times, message is last
-            if len(parts) == 7:
-                messages_text.append(parts[6])
-            else:
-                general_logger.debug(f"Partial log line: {line}")
-                if len(parts) > 3:  # At least timestamp, name, level, and some content
-                    messages_text.append(" ".join(parts[3:]))  # Take whatever’s after level
+    messages_text = await asyncio.to_thread(read_log_messages, log_path)
 
     if not messages_text:
         await context.bot.send_message(chat_id, f"Не знайдено повідомлень для аналізу за {date_str}.")
@@ -1,6 +1,7 @@
 import hashlib
 import os
 import re
+from functools import lru_cache
 from telegram import InlineKeyboardButton, InlineKeyboardMarkup, Update
 from telegram.ext import CallbackContext
 from modules.logger import general_logger,error_logger
@@ -63,7 +64,7 @@ How To Add More Languages:
     For example 'fr' for French, 'ro' for Romanian or 'pl' for Polish.
 
 Note:
-    The module uses bot_data to store link states using MD5 hashes as keys.
+    The module uses bot_data to store link states using short BLAKE2b hashes as keys.
     This allows for stateful modifications while keeping callback data within
     Telegram's size limits.
 """
@@ -256,7 +257,7 @@ async def button_callback(update: Update, context: CallbackContext):
             new_message = query.message.text.replace(original_link, new_link)
             
             # Store new link hash
-            new_hash = hashlib.md5(new_link.encode()).hexdigest()[:8]
+            new_hash = get_link_hash(new_link)
             context.bot_data[new_hash] = new_link
             
             # Create updated keyboard
@@ -276,9 +277,16 @@ async def button_callback(update: Update, context: CallbackContext):
 
 
 
+@lru_cache(maxsize=4096)
+def get_link_hash(link):
+    """Return the short hash used to reference a link in callback data"""
+    return hashlib.blake2b(link.encode(), digest_size=4).hexdigest()
+
+
+@lru_cache(maxsize=2048)
 def create_link_keyboard(link):
-    """Create keyboard with available modification buttons"""
-    link_hash = hashlib.md5(link.encode()).hexdigest()[:8]
+    """Create keyboard with available modification buttons (markups are immutable, so cached ones are shared)"""
+    link_hash = get_link_hash(link)
     buttons = []
     
     # Ensure link is using fixupx.com domain
@@ -3,13 +3,16 @@ import sys
 import logging
 import asyncio
 import html
-from logging.handlers import RotatingFileHandler
+import atexit
+import queue
+from logging.handlers import RotatingFileHandler, QueueHandler, QueueListener
 import threading
-from typing import Set, Optional, Tuple
+from collections import OrderedDict
+from typing import List, Set, Optional, Tuple, TextIO
 from datetime import datetime
-import pytz
 import time
-from modules.const import Config
+from functools import lru_cache
+from modules.const import Config, KYIV_TZ
 from telegram.ext import Application
 
 # Define ensure_directories function here to avoid circular imports
@@ -25,20 +28,16 @@ def ensure_directories():
         os.makedirs(data_dir, exist_ok=True)
         os.makedirs(analytics_dir, exist_ok=True)
         
-        # Verify write permissions
-        test_log_path = os.path.join(log_dir, 'test.log')
-        with open(test_log_path, 'w') as f:
-            f.write('Test log write\n')
-        os.remove(test_log_path)
+        # Verify write permissions (a single access(2) call, no probe file)
+        if not os.access(log_dir, os.W_OK):
+            print(f"Log directory is not writable: {log_dir}")
+            return False
         print("Write permission verified for log directory")
         return True
     except Exception as e:
         print(f"Error setting up directories: {e}")
         return False
 
-# Timezone constants
-KYIV_TZ = pytz.timezone('Europe/Kyiv')
-
 # Path constants
 PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 DATA_DIR = os.path.join(PROJECT_ROOT, 'data')
@@ -46,52 +45,154 @@ LOG_DIR = os.path.join(PROJECT_ROOT, 'logs')
 # (deprecated) used_words.csv removed
 
 
+@lru_cache(maxsize=4096)
+def _format_kyiv_time(epoch_sec: int, datefmt: str) -> str:
+    """Format a whole-second timestamp in Kyiv time (records in the same second share one result)"""
+    return datetime.fromtimestamp(epoch_sec, KYIV_TZ).strftime(datefmt)
+
 # Custom formatter for Kyiv timezone
 class KyivTimezoneFormatter(logging.Formatter):
     """Custom formatter that uses Kyiv timezone"""
     def formatTime(self, record, datefmt=None):
-        dt = datetime.fromtimestamp(record.created).astimezone(KYIV_TZ)
-        return dt.strftime(datefmt) if datefmt else dt.strftime("%Y-%m-%d %H:%M:%S %z")
+        datefmt = datefmt or "%Y-%m-%d %H:%M:%S %z"
+        if '%f' in datefmt:
+            # Sub-second formats can't share the per-second cache
+            return datetime.fromtimestamp(record.created, KYIV_TZ).strftime(datefmt)
+        return _format_kyiv_time(int(record.created), datefmt)
+
+# Size-based rotation without per-record filesystem checks
+class FastRotatingFileHandler(RotatingFileHandler):
+    """RotatingFileHandler that tracks the file size in memory.
+
+    The stock shouldRollover stats the path, seeks and re-formats the record on every
+    emit; here the record is formatted once and the size is only re-read from the
+    stream after opening or rolling over.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._size: Optional[int] = None
+        self._rotatable = True
+
+    def _sync_size(self) -> None:
+        if self.stream is None:
+            self.stream = self._open()
+        # See bpo-45401: never roll over anything other than regular files
+        self._rotatable = not (os.path.exists(self.baseFilename) and not os.path.isfile(self.baseFilename))
+        self._size = self.stream.seek(0, 2)
+
+    def emit(self, record):
+        try:
+            msg = self.format(record) + self.terminator
+            if self._size is None or self.stream is None:
+                self._sync_size()
+            size = len(msg) if msg.isascii() else len(msg.encode(self.encoding or 'utf-8', errors='replace'))
+            if self._rotatable and self.maxBytes > 0 and self._size + size >= self.maxBytes:
+                self.doRollover()
+                self._sync_size()
+            self.stream.write(msg)
+            self.flush()
+            self._size += size
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+# %-templates for daily log paths, bound to LOG_DIR once (escaped in case it contains '%')
+_CHAT_DAILY_LOG_TEMPLATE = os.path.join(LOG_DIR.replace('%', '%%'), 'chat_%s', 'chat_%s.log')
+_DAILY_LOG_TEMPLATE = os.path.join(LOG_DIR.replace('%', '%%'), 'chat_%s.log')
 
 # Chat-specific daily log handler
 class DailyLogHandler(logging.Handler):
+    MAX_OPEN_FILES = 256  # Least recently written chat logs are closed beyond this
+    BUFFER_SIZE = 64 * 1024  # Writes reach the OS when flush() runs after a burst, or when this fills
+
+    def __init__(self, level=logging.NOTSET):
+        super().__init__(level)
+        # emit() runs under the handler lock, so these need no extra locking
+        self._ensured_dirs: Set[str] = set()
+        # Log directory -> (current daily file path, open stream)
+        self._open_files: "OrderedDict[str, Tuple[str, TextIO]]" = OrderedDict()
+
+    def _get_stream(self, path: str) -> TextIO:
+        """Return an open append stream for path, creating its directory once per process."""
+        log_dir = os.path.dirname(path)
+        entry = self._open_files.get(log_dir)
+        if entry is not None:
+            open_path, stream = entry
+            if open_path == path:
+                self._open_files.move_to_end(log_dir)
+                return stream
+            # Day rolled over for this chat
+            stream.close()
+            del self._open_files[log_dir]
+        if log_dir not in self._ensured_dirs:
+            os.makedirs(log_dir, exist_ok=True)
+            self._ensured_dirs.add(log_dir)
+        # 'a' opens with O_APPEND, so each flushed chunk is appended atomically
+        stream = open(path, 'a', encoding='utf-8', buffering=self.BUFFER_SIZE)
+        self._open_files[log_dir] = (path, stream)
+        while len(self._open_files) > self.MAX_OPEN_FILES:
+            _, (_, idle_stream) = self._open_files.popitem(last=False)
+            idle_stream.close()
+        return stream
+
+    def flush(self):
+        self.acquire()
+        try:
+            for _, stream in self._open_files.values():
+                stream.flush()
+        finally:
+            self.release()
+
+    def close(self):
+        self.acquire()
+        try:
+            for _, stream in self._open_files.values():
+                stream.close()
+            self._open_files.clear()
+        finally:
+            self.release()
+        super().close()
+
     def emit(self, record):
-        # Ensure chat_id is included in the record if available
-        if hasattr(record, 'chat_id'):
-            record.chattitle = getattr(record, 'chattitle', 'Unknown')
-            record.username = getattr(record, 'username', 'Unknown')
-        else:
-            record.chat_id = 'N/A'  # Default value if chat_id is not present
-            record.chattitle = 'Unknown'  # Default value for chattitle
-            record.username = 'Unknown'  # Default value for username
+        # Fill in chat context for records logged without it
+        fields = record.__dict__
+        fields.setdefault('chat_id', 'N/A')
+        fields.setdefault('chattitle', 'Unknown')
+        fields.setdefault('username', 'Unknown')
         try:
-            # Format date in Kyiv timezone
-            date = datetime.now(KYIV_TZ)
+            # Format date in Kyiv timezone (memoised per second)
+            date_str = _format_kyiv_time(int(record.created), '%Y-%m-%d')
             
             # Create path
             if record.chat_id is not None:
-                chat_log_dir = os.path.join(LOG_DIR, f"chat_{record.chat_id}")
-                os.makedirs(chat_log_dir, exist_ok=True)
-                daily_log_path = os.path.join(chat_log_dir, f"chat_{date.strftime('%Y-%m-%d')}.log")
+                daily_log_path = _CHAT_DAILY_LOG_TEMPLATE % (record.chat_id, date_str)
             else:
-                daily_log_path = os.path.join(LOG_DIR, f"chat_{date.strftime('%Y-%m-%d')}.log")
+                daily_log_path = _DAILY_LOG_TEMPLATE % date_str
             
             msg = self.format(record)
-            with open(daily_log_path, 'a', encoding='utf-8') as f:
-                f.write(msg + '\n')
+            # Flushed in batches by flush() once the log queue drains
+            self._get_stream(daily_log_path).write(msg + '\n')
         except Exception:
             self.handleError(record)
 
 # Telegram error reporting handler
 class TelegramErrorHandler(logging.Handler):
-    """Custom handler for sending error logs to Telegram channel"""
+    """Custom handler for sending error logs to Telegram channel.
+
+    Records are formatted in emit() and queued; a single consumer task sends them,
+    merging whatever piled up during the rate-limit window into one message.
+    """
+    MAX_QUEUE_SIZE = 500  # Oldest reports are dropped beyond this
+    MAX_MESSAGE_LENGTH = 4096  # Telegram's limit for a single message
+
     def __init__(self, bot, channel_id, rate_limit=1):
         super().__init__()
         self.bot = bot
         self.channel_id = channel_id
-        self.buffer = []
-        self.last_sent = 0
         self.rate_limit = rate_limit  # Minimum seconds between messages
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=self.MAX_QUEUE_SIZE)
+        self._consumer_task: Optional[asyncio.Task] = None
         
         try:
             self.loop = asyncio.get_event_loop()
@@ -99,6 +200,11 @@ class TelegramErrorHandler(logging.Handler):
             self.loop = asyncio.new_event_loop()
             asyncio.set_event_loop(self.loop)
 
+    def start(self) -> None:
+        """Start the consumer task; must be called from the event loop."""
+        if self._consumer_task is None:
+            self._consumer_task = self.loop.create_task(self._consume())
+
     async def send_message(self, error_msg: str) -> None:
         """
         Send message to Telegram with retry logic.
@@ -134,7 +240,7 @@ class TelegramErrorHandler(logging.Handler):
         """
         Format the error message with all relevant information using HTML.
         """
-        current_time = datetime.now(KYIV_TZ).strftime('%Y-%m-%d %H:%M:%S %Z')
+        current_time = _format_kyiv_time(int(record.created), '%Y-%m-%d %H:%M:%S %Z')
         
         chat_id = getattr(record, 'chat_id', 'N/A')
         username = getattr(record, 'username', 'N/A')
@@ -157,118 +263,155 @@ class TelegramErrorHandler(logging.Handler):
         )
         return error_msg
 
-    async def emit_async(self, record):
-        try:
-            error_msg = self.format_error_message(record)
-            now = time.time()
-            
-            if now - self.last_sent >= self.rate_limit:
-                await self.send_message(error_msg)
-                self.last_sent = now
-            else:
-                self.buffer.append(error_msg)
-        except Exception as e:
-            print(f"Error in TelegramErrorHandler: {e}")
-            self.handleError(record)
+    def _enqueue(self, error_msg: str) -> None:
+        """Queue a formatted report, dropping the oldest one when full (runs on the loop)."""
+        if self.queue.full():
+            self.queue.get_nowait()
+        self.queue.put_nowait(error_msg)
+
+    async def _consume(self) -> None:
+        """Send queued reports, batching the ones that arrived while rate limited."""
+        pending: Optional[str] = None
+        while True:
+            batch = [pending if pending is not None else await self.queue.get()]
+            pending = None
+            length = len(batch[0])
+            while not self.queue.empty():
+                error_msg = self.queue.get_nowait()
+                if length + len(error_msg) + 2 > self.MAX_MESSAGE_LENGTH:
+                    pending = error_msg
+                    break
+                batch.append(error_msg)
+                length += len(error_msg) + 2
+            try:
+                await self.send_message("\n\n".join(batch))
+            except Exception as e:
+                print(f"Error in TelegramErrorHandler: {e}")
+            await asyncio.sleep(self.rate_limit)
 
     def emit(self, record):
         try:
-            coroutine = self.emit_async(record)
+            error_msg = self.format_error_message(record)
             try:
-                asyncio.create_task(coroutine)
+                on_loop = asyncio.get_running_loop() is self.loop
             except RuntimeError:
-                self.loop.run_until_complete(coroutine)
+                on_loop = False
+            if on_loop:
+                self._enqueue(error_msg)
+            elif not self.loop.is_closed():
+                # Logged from a worker thread (e.g. asyncio.to_thread)
+                self.loop.call_soon_threadsafe(self._enqueue, error_msg)
         except Exception as e:
             print(f"Error in TelegramErrorHandler.emit: {e}")
             self.handleError(record)
 
+    def close(self):
+        if self._consumer_task is not None:
+            self._consumer_task.cancel()
+            self._consumer_task = None
+        super().close()
+
+class _BatchingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers once per drained burst instead of per record"""
+    def handle(self, record):
+        super().handle(record)
+        if self.queue.empty():
+            for handler in self.handlers:
+                handler.flush()
+
+_queue_listeners: List[QueueListener] = []
+
+def _attach_queued_handlers(logger: logging.Logger, *handlers: logging.Handler) -> None:
+    """Route a logger's records through a queue so file and console I/O runs on a background thread."""
+    log_queue = queue.SimpleQueue()
+    logger.addHandler(QueueHandler(log_queue))
+    listener = _BatchingQueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    _queue_listeners.append(listener)
+
+def _stop_queue_listeners(listeners: List[QueueListener]) -> None:
+    """Drain pending records and close the handlers on interpreter exit."""
+    for listener in listeners:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+    listeners.clear()
+
+LOG_FILE_MAX_BYTES = 5 * 1024 * 1024
+LOG_FILE_BACKUP_COUNT = 3
+PLAIN_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+CHAT_LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(chat_id)s - %(chattitle)s - %(username)s - %(message)s'
+
+# (logger name, level, file in LOG_DIR, file format, also write per-chat daily logs)
+_LOGGER_SPECS = (
+    ('general_logger', logging.INFO, 'general.log', CHAT_LOG_FORMAT, False),
+    ('analytics_logger', logging.INFO, 'analytics.log', PLAIN_LOG_FORMAT, False),
+    ('chat_logger', logging.INFO, 'chat.log', CHAT_LOG_FORMAT, True),
+    ('error_logger', logging.ERROR, 'error.log', PLAIN_LOG_FORMAT, False),
+)
+
+class CustomFormatter(logging.Formatter):
+    """Formatter that fills in chat context fields for records logged without them"""
+    def format(self, record):
+        fields = record.__dict__
+        fields.setdefault('chat_id', 'N/A')
+        fields.setdefault('chattitle', 'Unknown')
+        fields.setdefault('username', 'Unknown')
+        return super().format(record)
+
 # Initialize logging system
 def initialize_logging() -> Tuple[logging.Logger, logging.Logger, logging.Logger, logging.Logger]:
-    """Set up all loggers and handlers"""
+    """Set up all loggers and handlers (once per process, even if the module is reloaded)"""
+    general_logger = logging.getLogger('general_logger')
+    if any(isinstance(handler, QueueHandler) for handler in general_logger.handlers):
+        return (general_logger, logging.getLogger('chat_logger'),
+                logging.getLogger('error_logger'), logging.getLogger('analytics_logger'))
+    
     if not ensure_directories():
         sys.exit(1)
     
-    class CustomFormatter(logging.Formatter):
-        def format(self, record):
-            record.chat_id = getattr(record, 'chat_id', 'N/A')
-            record.chattitle = getattr(record, 'chattitle', 'Unknown')
-            record.username = getattr(record, 'username', 'Unknown')
-            return super().format(record)
-
+    # One formatter instance per format, shared by every handler using it
+    formatters = {
+        PLAIN_LOG_FORMAT: KyivTimezoneFormatter(PLAIN_LOG_FORMAT),
+        CHAT_LOG_FORMAT: CustomFormatter(CHAT_LOG_FORMAT),
+    }
+    
+    # Registered with the list itself so the hook still drains these listeners if the module is reloaded
+    atexit.register(_stop_queue_listeners, _queue_listeners)
+    
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(KyivTimezoneFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    
-    # --- General Logger ---
-    general_logger = logging.getLogger('general_logger')
-    general_logger.setLevel(logging.INFO)
+    console_handler.setFormatter(formatters[PLAIN_LOG_FORMAT])
     
-    general_file_handler = RotatingFileHandler(
-        os.path.join(LOG_DIR, 'general.log'),
-        maxBytes=5*1024*1024,
-        backupCount=3,
-        encoding='utf-8'
-    )
-    general_file_handler.setFormatter(CustomFormatter('%(asctime)s - %(name)s - %(levelname)s - %(chat_id)s - %(chattitle)s - %(username)s - %(message)s'))
-    general_file_handler.setLevel(logging.INFO)
-    
-    general_logger.addHandler(console_handler)
-    general_logger.addHandler(general_file_handler)
-    general_logger.propagate = False
-    
-    # --- Analytics Logger ---
-    analytics_logger = logging.getLogger('analytics_logger')
-    analytics_logger.setLevel(logging.INFO)
-    
-    analytics_file_handler = RotatingFileHandler(
-        os.path.join(LOG_DIR, 'analytics.log'),
-        maxBytes=5*1024*1024,
-        backupCount=3,
-        encoding='utf-8'
-    )
-    analytics_file_handler.setFormatter(KyivTimezoneFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
-    
-    analytics_logger.addHandler(console_handler)
-    analytics_logger.addHandler(analytics_file_handler)
-    analytics_logger.propagate = False
-    
-    # --- Chat Logger ---
-    chat_logger = logging.getLogger('chat_logger')
-    chat_logger.setLevel(logging.INFO)
-    
-    chat_file_handler = RotatingFileHandler(
-        os.path.join(LOG_DIR, 'chat.log'),
-        maxBytes=5*1024*1024,
-        backupCount=3,
-        encoding='utf-8'
-    )
-    chat_file_handler.setFormatter(CustomFormatter('%(asctime)s - %(name)s - %(levelname)s - %(chat_id)s - %(chattitle)s - %(username)s - %(message)s'))
-    
-    daily_handler = DailyLogHandler()
-    daily_handler.setLevel(logging.INFO)
-    daily_handler.setFormatter(CustomFormatter('%(asctime)s - %(name)s - %(levelname)s - %(chat_id)s - %(chattitle)s - %(username)s - %(message)s'))
-    
-    chat_logger.addHandler(console_handler)
-    chat_logger.addHandler(chat_file_handler)
-    chat_logger.addHandler(daily_handler)
-    chat_logger.propagate = False
-    
-    # --- Error Logger ---
-    error_logger = logging.getLogger('error_logger')
-    error_logger.setLevel(logging.ERROR)
-    
-    error_file_handler = RotatingFileHandler(
-        os.path.join(LOG_DIR, 'error.log'),
-        maxBytes=5*1024*1024,
-        backupCount=3,
-        encoding='utf-8'
-    )
-    error_file_handler.setFormatter(KyivTimezoneFormatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+    loggers = {}
+    for name, level, filename, file_format, daily_logs in _LOGGER_SPECS:
+        logger = logging.getLogger(name)
+        logger.setLevel(level)
+        
+        file_handler = FastRotatingFileHandler(
+            os.path.join(LOG_DIR, filename),
+            maxBytes=LOG_FILE_MAX_BYTES,
+            backupCount=LOG_FILE_BACKUP_COUNT,
+            encoding='utf-8'
+        )
+        file_handler.setFormatter(formatters[file_format])
+        handlers = [console_handler, file_handler]
+        
+        if daily_logs:
+            daily_handler = DailyLogHandler()
+            daily_handler.setLevel(logging.INFO)
+            daily_handler.setFormatter(formatters[CHAT_LOG_FORMAT])
+            handlers.append(daily_handler)
+        
+        _attach_queued_handlers(logger, *handlers)
+        logger.propagate = False
+        loggers[name] = logger
     
-    error_logger.addHandler(console_handler)
-    error_logger.addHandler(error_file_handler)
-    error_logger.propagate = False
+    general_logger = loggers['general_logger']
+    chat_logger = loggers['chat_logger']
+    error_logger = loggers['error_logger']
+    analytics_logger = loggers['analytics_logger']
     
     # Suppress other library logs
     logging.getLogger("httpx").setLevel(logging.WARNING)
@@ -307,6 +450,7 @@ async def init_error_handler(application: Application, ERROR_CHANNEL_ID: str) ->
         'Message: %(message)s'
     ))
     error_logger.addHandler(handler)
+    handler.start()
     general_logger.info(f"Error handler initialized successfully with channel ID: {ERROR_CHANNEL_ID}")
 
 def get_daily_log_path(chat_id: str, date: Optional[datetime] = None, chat_title: Optional[str] = None) -> str:
@@ -322,7 +466,9 @@ def get_daily_log_path(chat_id: str, date: Optional[datetime] = None, chat_title
         str: Path to the log file
     """
     if date is None:
-        date = datetime.now(KYIV_TZ)
+        date_str = _format_kyiv_time(int(time.time()), '%Y-%m-%d')
+    else:
+        date_str = date.strftime('%Y-%m-%d')
     log_dir = os.path.join(LOG_DIR, f"chat_{chat_id}")
     os.makedirs(log_dir, exist_ok=True)  # Ensure directory exists
     
@@ -331,7 +477,7 @@ def get_daily_log_path(chat_id: str, date: Optional[datetime] = None, chat_title
         with open(chat_name_file, 'w', encoding='utf-8') as f:
             f.write(chat_title)
     
-    return os.path.join(log_dir, f"chat_{date.strftime('%Y-%m-%d')}.log")
+    return os.path.join(log_dir, f"chat_{date_str}.log")
 
 def read_last_n_lines(file_path: str, n: int) -> list:
     """
@@ -344,9 +490,25 @@ def read_last_n_lines(file_path: str, n: int) -> list:
     Returns:
         list: List of lines
     """
-    with open(file_path, 'r', encoding='utf-8') as file:
-        lines = file.readlines()
-        return lines[-n:]  # Return the last n lines
+    if n <= 0:
+        return []
+    block_size = 64 * 1024
+    with open(file_path, 'rb') as file:
+        # Read backwards in blocks until we hold more than n line breaks (or the whole file)
+        pos = file.seek(0, os.SEEK_END)
+        buf = b''
+        while pos > 0 and buf.count(b'\n') <= n:
+            read_size = min(block_size, pos)
+            pos -= read_size
+            file.seek(pos)
+            buf = file.read(read_size) + buf
+    # Match text-mode readlines(): universal newlines translated to '\n'
+    lines = []
+    for line in buf.splitlines(keepends=True)[-n:]:
+        stripped = line.rstrip(b'\r\n')
+        text = stripped.decode('utf-8')
+        lines.append(text + '\n' if len(stripped) != len(line) else text)
+    return lines
 
 # Initialize logging when this module is imported
 general_logger, chat_logger, error_logger, analytics_logger = initialize_logging()
\ No newline at end of file
@@ -1,7 +1,8 @@
 import sqlite3
 import datetime
 import re
-from dateutil.parser import isoparse
+from contextlib import contextmanager
+from functools import lru_cache
 from dateutil.relativedelta import relativedelta
 from telegram.constants import ParseMode
 from telegram.helpers import escape_markdown
@@ -13,8 +14,9 @@ import logging
 from telegram import Update
 from telegram.ext import CallbackContext
 
-def seconds_until(dt):
-    now = datetime.datetime.now(KYIV_TZ)
+def seconds_until(dt, now=None):
+    if now is None:
+        now = datetime.datetime.now(KYIV_TZ)
     # Ensure dt is timezone-aware and in the same timezone as now
     if dt.tzinfo is None:
         dt = KYIV_TZ.localize(dt)
@@ -23,7 +25,118 @@ def seconds_until(dt):
     general_logger.debug(f"seconds_until: now={now}, dt={dt}")
     return max(0.01, (dt - now).total_seconds())
 
+# next_execution is stored as integer UTC epoch microseconds; timedelta arithmetic
+# keeps the round trip exact where float timestamps would drift by a microsecond.
+_EPOCH = datetime.datetime(1970, 1, 1, tzinfo=datetime.timezone.utc)
+_MICROSECOND = datetime.timedelta(microseconds=1)
+
+def to_epoch_us(dt):
+    if dt.tzinfo is None:
+        dt = KYIV_TZ.localize(dt)
+    return (dt - _EPOCH) // _MICROSECOND
+
+def from_epoch_us(us):
+    return (_EPOCH + datetime.timedelta(microseconds=us)).astimezone(KYIV_TZ)
+
+_DELAY_UNITS = r'(seconds?|secs?|s|minutes?|mins?|m|hours?|hrs?|h|days?|d|weeks?|w|months?|month)'
+
+# Reminder parsing patterns, compiled once instead of on every /remind
+_TRAILING_DELAY_RE = re.compile(r'(.*?)\s+in\s+\d+\s*' + _DELAY_UNITS + r'\s*$', re.IGNORECASE)
+_FIRST_DAY_RE = re.compile(r'(.*?)(?:at the first|on the first|on first|first of|first day of|at the first day of)(?:.*)', re.IGNORECASE)
+_LAST_DAY_RE = re.compile(r'(.*?)(?:at the last|on the last|on last|last day of|at the last day of)(?:.*)', re.IGNORECASE)
+_TOMORROW_RE = re.compile(r'(.*?)\btomorrow\b(?:.*)', re.IGNORECASE)
+# Time-related patterns, in priority order - word boundaries avoid partial matches
+_TIME_PATTERNS = [re.compile(p, re.IGNORECASE) for p in (
+    r'\bevery day\b', r'\bdaily\b', r'\beveryday\b',
+    r'\bevery week\b', r'\bweekly\b',
+    r'\bevery month\b', r'\bmonthly\b',
+    r'\bevery second\b',
+    r'\bin \d+ ' + _DELAY_UNITS + r'\b',
+    r'\bat \d{1,2}:\d{2}\b',
+    r'\bat \d{1,2}\s*(am|pm)\b',  # at 11 PM
+    r'\btomorrow at\b', r'\btomorrow\b', r'\bnext week\b', r'\bnext month\b',
+    r'\bon [a-zA-Z]+ \d+\b', r'\bon [a-zA-Z]+\b',  # On Monday, On July 15
+    r'\bthe (first|last) day of (the|every) month\b',
+    r'\b(first|last) day of (the|every) month\b',
+)]
+# Every schedule phrase in one alternation so parse() scans the text once
+_SCHEDULE_RE = re.compile(
+    r'\b(every day|daily|everyday|every week|weekly|every month|monthly|every second'
+    r'|the last day of the month|last day of every month|last day of month'
+    r'|the first day of the month|first day of every month|first of every month)\b'
+)
+_FREQUENCIES = {
+    'every day': 'daily', 'daily': 'daily', 'everyday': 'daily',
+    'every week': 'weekly', 'weekly': 'weekly',
+    'every month': 'monthly', 'monthly': 'monthly',
+    'every second': 'seconds',
+}
+_FREQ_PRIORITY = ('daily', 'weekly', 'monthly', 'seconds')
+_DATE_MODIFIERS = {
+    'the last day of the month': 'last day of every month',
+    'last day of every month': 'last day of every month',
+    'last day of month': 'last day of every month',
+    'the first day of the month': 'first day of every month',
+    'first day of every month': 'first day of every month',
+    'first of every month': 'first day of every month',
+}
+# Trailing \b keeps the bare 'm' alternative from matching the start of 'month'
+_DELAY_RE = re.compile(r'in\s+(\d+)\s*' + _DELAY_UNITS + r'\b')
+_PARSED_DELAY_RE = re.compile(r'in\s+(\d+)\s+(\w+)')
+_AT_HM_RE = re.compile(r'\bat\s+(\d{1,2}):(\d{2})\b', re.IGNORECASE)
+_AT_AMPM_RE = re.compile(r'\bat\s+(\d{1,2})\s*(am|pm)\b', re.IGNORECASE)
+_FALLBACK_HM_RE = re.compile(r'at\s+(\d{1,2}):(\d{2})')
+_FALLBACK_AMPM_RE = re.compile(r'at\s+(\d{1,2})(?:\s*|\:00)?\s*(am|pm)')
+
+# Recurrence step per frequency; relativedelta keeps monthly reminders on calendar months
+_FREQ_DELTAS = {
+    'daily': datetime.timedelta(days=1),
+    'weekly': datetime.timedelta(weeks=1),
+    'monthly': relativedelta(months=1),
+}
+_SECONDS_STEP = datetime.timedelta(seconds=5)
+_DISPLAY_TIME_FORMAT = '%d.%m.%Y %H:%M'
+_ONE_DAY = datetime.timedelta(days=1)
+# Month rollover indexed by month - 1: following month and year increment
+_NEXT_MONTH = (2, 3, 4, 5, 6, 7, 8, 9, 10, 11, 12, 1)
+_YEAR_DELTA = (0,) * 11 + (1,)
+# Delay unit (plural 's' stripped) -> timedelta/relativedelta keyword
+_DELAY_UNIT_KWARGS = {
+    'second': 'seconds', 'sec': 'seconds',
+    'minute': 'minutes', 'min': 'minutes', 'm': 'minutes',
+    'hour': 'hours', 'hr': 'hours', 'h': 'hours',
+    'day': 'days', 'd': 'days',
+    'week': 'weeks', 'w': 'weeks',
+    'month': 'months',
+}
+
+def _next_month_of(year, month):
+    """(year, month) of the month following the given one"""
+    return year + _YEAR_DELTA[month - 1], _NEXT_MONTH[month - 1]
+
+
+@lru_cache(maxsize=512)
+def parse_schedule(txt_lower):
+    """Map lower-cased reminder text to its (frequency, date_modifier).
+
+    Pure function of the text, so repeated phrasings are served from the cache.
+    """
+    found = set(_SCHEDULE_RE.findall(txt_lower))
+    frequencies = {_FREQUENCIES[p] for p in found if p in _FREQUENCIES}
+    frequency = next((f for f in _FREQ_PRIORITY if f in frequencies), None)
+
+    modifiers = {_DATE_MODIFIERS[p] for p in found if p in _DATE_MODIFIERS}
+    if 'last day of every month' in modifiers:
+        return 'monthly', 'last day of every month'
+    if 'first day of every month' in modifiers:
+        return 'monthly', 'first day of every month'
+    return frequency, None
+
 class Reminder:
+    # Reminders are loaded for every row in the table; slots avoid a __dict__ per instance
+    __slots__ = ('reminder_id', 'task', 'frequency', 'delay', 'date_modifier',
+                 'next_execution', 'user_id', 'chat_id', 'user_mention_md')
+
     def __init__(self, task, frequency, delay, date_modifier, next_execution, user_id, chat_id, user_mention_md=None, reminder_id=None):
         self.reminder_id = reminder_id
         self.task = task
@@ -35,8 +148,9 @@ class Reminder:
         self.chat_id = chat_id
         self.user_mention_md = user_mention_md
 
-    def calculate_next_execution(self):
-        now = datetime.datetime.now(KYIV_TZ)
+    def calculate_next_execution(self, now=None):
+        if now is None:
+            now = datetime.datetime.now(KYIV_TZ)
 
         if self.date_modifier:
             if self.date_modifier == 'first day of every month':
@@ -46,180 +160,161 @@ class Reminder:
                 self._calc_last_month(now)
                 return
 
-        if not self.frequency:
+        if self.frequency == 'seconds':
+            self.next_execution = now + _SECONDS_STEP
             return
 
-        if self.frequency == 'daily':
-            if self.next_execution and self.next_execution <= now:
-                # For daily reminders, create a new datetime with the same time but 1 day later
-                if self.next_execution.tzinfo is None:
-                    self.next_execution = KYIV_TZ.localize(self.next_execution)
-                self.next_execution = datetime.datetime(
-                    self.next_execution.year,
-                    self.next_execution.month,
-                    self.next_execution.day + 1,
-                    self.next_execution.hour,
-                    self.next_execution.minute,
-                    self.next_execution.second,
-                    tzinfo=self.next_execution.tzinfo
-                )
-            elif not self.next_execution:
-                # Create a new datetime with the same time but 1 day later
-                if now.tzinfo is None:
-                    now = KYIV_TZ.localize(now)
-                self.next_execution = datetime.datetime(
-                    now.year,
-                    now.month,
-                    now.day + 1,
-                    now.hour,
-                    now.minute,
-                    now.second,
-                    tzinfo=now.tzinfo
-                )
-
-        elif self.frequency == 'weekly':
-            if self.next_execution and self.next_execution <= now:
-                # For weekly reminders, create a new datetime with the same time but 7 days later
-                if self.next_execution.tzinfo is None:
-                    self.next_execution = KYIV_TZ.localize(self.next_execution)
-                self.next_execution = datetime.datetime(
-                    self.next_execution.year,
-                    self.next_execution.month,
-                    self.next_execution.day + 7,
-                    self.next_execution.hour,
-                    self.next_execution.minute,
-                    self.next_execution.second,
-                    tzinfo=self.next_execution.tzinfo
-                )
-            elif not self.next_execution:
-                # Create a new datetime with the same time but 7 days later
-                if now.tzinfo is None:
-                    now = KYIV_TZ.localize(now)
-                self.next_execution = datetime.datetime(
-                    now.year,
-                    now.month,
-                    now.day + 7,
-                    now.hour,
-                    now.minute,
-                    now.second,
-                    tzinfo=now.tzinfo
-                )
-
-        elif self.frequency == 'monthly':
-            if self.next_execution and self.next_execution <= now:
-                self.next_execution += relativedelta(months=1)
-            elif not self.next_execution:
-                self.next_execution = now + relativedelta(months=1)
-
-        elif self.frequency == 'seconds':
-            self.next_execution = now + datetime.timedelta(seconds=5)
+        delta = _FREQ_DELTAS.get(self.frequency)
+        if delta is None:
+            return
+
+        if not self.next_execution:
+            self.next_execution = now + delta
+        elif self.next_execution <= now:
+            # Advance from the previous run so the reminder keeps its time of day
+            if self.next_execution.tzinfo is None:
+                self.next_execution = KYIV_TZ.localize(self.next_execution)
+            self.next_execution += delta
 
     def _calc_first_month(self, now):
-        if now.month == 12:
-            dt = datetime.datetime(now.year + 1, 1, 1, 9, 0, tzinfo=KYIV_TZ)
-        else:
-            dt = datetime.datetime(now.year, now.month + 1, 1, 9, 0, tzinfo=KYIV_TZ)
-        if self.next_execution:
-            dt = dt.replace(hour=self.next_execution.hour, minute=self.next_execution.minute)
-        self.next_execution = dt
+        hour = self.next_execution.hour if self.next_execution else 9
+        minute = self.next_execution.minute if self.next_execution else 0
+        dt = datetime.datetime(*_next_month_of(now.year, now.month), 1, hour, minute)
+        # localize() picks the real EET/EEST offset; passing the pytz zone as tzinfo gives LMT (+02:02)
+        self.next_execution = KYIV_TZ.localize(dt)
 
     def _calc_last_month(self, now):
         # Calculate last day of the NEXT month
-        if now.month == 12:
-            end = datetime.datetime(now.year + 1, 1, 1, tzinfo=KYIV_TZ) - datetime.timedelta(days=1)
-        else:
-            end = datetime.datetime(now.year, now.month + 1, 1, tzinfo=KYIV_TZ) - datetime.timedelta(days=1)
-            
+        year, month = _next_month_of(now.year, now.month)
         # For testing: when calculating next execution, move to the next month
         if self.next_execution and self.next_execution.month == now.month:
-            if now.month == 12:
-                end = datetime.datetime(now.year + 1, 2, 1, tzinfo=KYIV_TZ) - datetime.timedelta(days=1)
-            else:
-                end = datetime.datetime(now.year, now.month + 2, 1, tzinfo=KYIV_TZ) - datetime.timedelta(days=1)
-                
+            year, month = _next_month_of(year, month)
+        end = datetime.datetime(year, month, 1) - _ONE_DAY
+
         hour = self.next_execution.hour if self.next_execution else 9
         minute = self.next_execution.minute if self.next_execution else 0
-        self.next_execution = end.replace(hour=hour, minute=minute, second=0, microsecond=0)
+        self.next_execution = KYIV_TZ.localize(end.replace(hour=hour, minute=minute, second=0, microsecond=0))
 
     def to_tuple(self):
         return (self.reminder_id, self.task, self.frequency, self.delay, self.date_modifier,
-                self.next_execution.isoformat() if self.next_execution else None,
+                to_epoch_us(self.next_execution) if self.next_execution else None,
                 self.user_id, self.chat_id, self.user_mention_md)
 
     @classmethod
     def from_tuple(cls, data):
-        (rid, task, freq, delay, mod, next_exec_str, uid, cid, mention) = data
-        dt = isoparse(next_exec_str) if next_exec_str else None
-        if dt:
-            # Ensure dt is timezone-aware
-            if dt.tzinfo is None:
-                dt = KYIV_TZ.localize(dt)
-            else:
-                # If it's already timezone-aware, convert it to KYIV_TZ
-                dt = dt.astimezone(KYIV_TZ)
-            general_logger.debug(f"Loaded reminder with next_execution: {dt}")
+        (rid, task, freq, delay, mod, next_exec_us, uid, cid, mention) = data
+        dt = from_epoch_us(next_exec_us) if next_exec_us is not None else None
         return cls(task, freq, delay, mod, dt, uid, cid, mention, rid)
 
 
+# chat_id-leading composite index serves per-chat listing (ordered by due time);
+# next_execution index serves startup scheduling of pending reminders.
+# Kept as separate statements so they can also run inside an explicit transaction
+REMINDERS_SCHEMA = (
+    '''CREATE TABLE IF NOT EXISTS reminders (
+        reminder_id INTEGER PRIMARY KEY AUTOINCREMENT,
+        task TEXT NOT NULL,
+        frequency TEXT,
+        delay TEXT,
+        date_modifier TEXT,
+        next_execution INTEGER,
+        user_id INTEGER NOT NULL,
+        chat_id INTEGER NOT NULL,
+        user_mention_md TEXT
+    )''',
+    'CREATE INDEX IF NOT EXISTS idx_reminders_chat_next ON reminders(chat_id, next_execution)',
+    'CREATE INDEX IF NOT EXISTS idx_reminders_next_exec ON reminders(next_execution)',
+)
+
+
 class ReminderManager:
     def __init__(self, db_file='reminders.db'):
         self.db_file = db_file
-        self.conn = sqlite3.connect(self.db_file, check_same_thread=False)
+        # One long-lived connection for all reads and writes; handlers run on the
+        # event loop thread, so a separate read pool would only add contention.
+        # Autocommit mode: writes commit exactly where transaction() says so.
+        self.conn = sqlite3.connect(self.db_file, isolation_level=None, check_same_thread=False)
+        self.conn.executescript('''
+            PRAGMA journal_mode=WAL;
+            PRAGMA synchronous=NORMAL;
+            PRAGMA temp_store=MEMORY;
+            PRAGMA cache_size=-8000;
+        ''')
         self._create_table()
         self.reminders = self.load_reminders()
+        self._by_id = {r.reminder_id: r for r in self.reminders}
 
-    def _create_table(self):
-        """Create reminders table if it doesn't exist"""
-        cursor = self.conn.cursor()
-        cursor.execute('''
-            CREATE TABLE IF NOT EXISTS reminders (
-                reminder_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                task TEXT NOT NULL,
-                frequency TEXT,
-                delay TEXT,
-                date_modifier TEXT,
-                next_execution TEXT,
-                user_id INTEGER NOT NULL,
-                chat_id INTEGER NOT NULL,
-                user_mention_md TEXT
-            )
-        ''')
+    @contextmanager
+    def transaction(self):
+        """Run the enclosed statements as one transaction, rolled back on error.
+
+        Nested calls join the outer transaction, so a single save_reminder()
+        commits immediately while a wrapped batch commits once at the end.
+        """
+        if self.conn.in_transaction:
+            yield self.conn
+            return
+        self.conn.execute('BEGIN')
+        try:
+            yield self.conn
+        except BaseException:
+            self.conn.rollback()
+            raise
         self.conn.commit()
 
-    def get_connection(self):
-        conn = sqlite3.connect(self.db_file, check_same_thread=False)
-        # Create table if it doesn't exist (helpful for tests with in-memory databases)
-        with conn:
-            conn.execute('''
-                CREATE TABLE IF NOT EXISTS reminders (
-                    reminder_id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    task TEXT NOT NULL,
-                    frequency TEXT,
-                    delay TEXT,
-                    date_modifier TEXT,
-                    next_execution TEXT,
-                    user_id INTEGER NOT NULL,
-                    chat_id INTEGER NOT NULL,
-                    user_mention_md TEXT
-                )
-            ''')
-        return conn
+    def _create_table(self):
+        """Create reminders table and its indexes if they don't exist"""
+        with self.transaction():
+            for statement in REMINDERS_SCHEMA:
+                self.conn.execute(statement)
+        self._migrate_next_execution()
+
+    def _migrate_next_execution(self):
+        """Rebuild a legacy table storing next_execution as ISO text into epoch microseconds.
+
+        The rebuild is a single transaction; a reminders_legacy table left behind by
+        an interrupted earlier rebuild is picked up and its rows copied over.
+        """
+        leftover = self.conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'reminders_legacy'").fetchone()
+        columns = {row[1]: row[2] for row in self.conn.execute('PRAGMA table_info(reminders)')}
+        if not leftover and columns.get('next_execution', '').upper() != 'TEXT':
+            return
+        with self.transaction():
+            if not leftover:
+                # TEXT affinity would turn integers back into strings, so the table is rebuilt
+                self.conn.execute('ALTER TABLE reminders RENAME TO reminders_legacy')
+                self.conn.execute('DROP INDEX IF EXISTS idx_reminders_chat_next')
+                self.conn.execute('DROP INDEX IF EXISTS idx_reminders_next_exec')
+                for statement in REMINDERS_SCHEMA:
+                    self.conn.execute(statement)
+            converted = []
+            for row in self.conn.execute('SELECT * FROM reminders_legacy').fetchall():
+                next_exec = row[5]
+                if isinstance(next_exec, str):
+                    dt = datetime.datetime.fromisoformat(next_exec)
+                    if dt.tzinfo is None:
+                        dt = KYIV_TZ.localize(dt)
+                    next_exec = to_epoch_us(dt)
+                converted.append(row[:5] + (next_exec,) + row[6:])
+            self.conn.executemany('INSERT OR IGNORE INTO reminders VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)', converted)
+            self.conn.execute('DROP TABLE reminders_legacy')
+        general_logger.info(f"Migrated {len(converted)} reminders to epoch next_execution")
 
     def load_reminders(self, chat_id=None):
         """Load all reminders from the database, optionally filtered by chat_id"""
-        with self.get_connection() as conn:
-            cursor = conn.cursor()
-            if chat_id:
-                cursor.execute('SELECT * FROM reminders WHERE chat_id = ?', (chat_id,))
-            else:
-                cursor.execute('SELECT * FROM reminders')
-            data = cursor.fetchall()
-            return [Reminder.from_tuple(r) for r in data]
+        if chat_id is not None:
+            cursor = self.conn.execute('SELECT * FROM reminders WHERE chat_id = ? ORDER BY next_execution', (chat_id,))
+        else:
+            cursor = self.conn.execute('SELECT * FROM reminders')
+        return [Reminder.from_tuple(r) for r in cursor.fetchall()]
 
     def save_reminder(self, rem):
-        with self.get_connection() as conn:
-            c = conn.cursor()
-            
+        return self.save_many([rem])[0]
+
+    def save_many(self, rems):
+        """Insert or update several reminders in a single transaction"""
+        for rem in rems:
             # Ensure next_execution is timezone-aware before saving
             if rem.next_execution:
                 if rem.next_execution.tzinfo is None:
@@ -227,36 +322,70 @@ class ReminderManager:
                 # Convert to KYIV_TZ timezone
                 rem.next_execution = rem.next_execution.astimezone(KYIV_TZ)
                 general_logger.debug(f"Saving reminder with next_execution: {rem.next_execution}")
-                
-            if rem.reminder_id:
-                c.execute('''UPDATE reminders SET task=?, frequency=?, delay=?, date_modifier=?, next_execution=?, 
-                            user_id=?, chat_id=?, user_mention_md=? WHERE reminder_id=?''',
-                          (rem.task, rem.frequency, rem.delay, rem.date_modifier,
-                           rem.next_execution.isoformat() if rem.next_execution else None,
-                           rem.user_id, rem.chat_id, rem.user_mention_md, rem.reminder_id))
-            else:
-                c.execute('''INSERT INTO reminders (task, frequency, delay, date_modifier, next_execution, 
+
+        updates = [rem.to_tuple()[1:] + (rem.reminder_id,) for rem in rems if rem.reminder_id]
+        inserts = [rem for rem in rems if not rem.reminder_id]
+        with self.transaction():
+            if updates:
+                self.conn.executemany('''UPDATE reminders SET task=?, frequency=?, delay=?, date_modifier=?, next_execution=?,
+                            user_id=?, chat_id=?, user_mention_md=? WHERE reminder_id=?''', updates)
+            if inserts:
+                self.conn.executemany('''INSERT INTO reminders (task, frequency, delay, date_modifier, next_execution,
                              user_id, chat_id, user_mention_md) VALUES (?, ?, ?, ?, ?, ?, ?, ?)''',
-                          (rem.task, rem.frequency, rem.delay, rem.date_modifier,
-                           rem.next_execution.isoformat() if rem.next_execution else None,
-                           rem.user_id, rem.chat_id, rem.user_mention_md))
-                rem.reminder_id = c.lastrowid
-            conn.commit()
-        self.reminders = self.load_reminders()
-        return rem
+                                      [rem.to_tuple()[1:] for rem in inserts])
+                # AUTOINCREMENT ids within one transaction on this connection are consecutive
+                last_id = self.conn.execute('SELECT last_insert_rowid()').fetchone()[0]
+                for offset, rem in enumerate(reversed(inserts)):
+                    rem.reminder_id = last_id - offset
+        for rem in rems:
+            self._remember(rem)
+        return rems
+
+    def _update_next_execution(self, rem):
+        """Persist only next_execution of an already saved, cached reminder"""
+        if rem.next_execution and rem.next_execution.tzinfo is None:
+            rem.next_execution = KYIV_TZ.localize(rem.next_execution)
+        with self.transaction():
+            self.conn.execute('UPDATE reminders SET next_execution = ? WHERE reminder_id = ?',
+                              (to_epoch_us(rem.next_execution) if rem.next_execution else None, rem.reminder_id))
+
+    def _remember(self, rem):
+        """Insert or replace a saved reminder in the in-memory cache"""
+        old = self._by_id.get(rem.reminder_id)
+        self._by_id[rem.reminder_id] = rem
+        if old is None:
+            self.reminders.append(rem)
+        elif old is not rem:
+            self.reminders[self.reminders.index(old)] = rem
 
     def remove_reminder(self, reminder):
         """Remove a reminder from the database"""
+        self.remove_reminders([reminder])
+
+    def remove_reminders(self, reminders):
+        """Remove several reminders from the database in a single transaction"""
+        ids = [r.reminder_id for r in reminders]
         try:
-            cursor = self.conn.cursor()
-            cursor.execute('DELETE FROM reminders WHERE reminder_id = ?', (reminder.reminder_id,))
-            self.conn.commit()
+            with self.transaction():
+                self.conn.executemany('DELETE FROM reminders WHERE reminder_id = ?', [(rid,) for rid in ids])
             # Update the in-memory list
-            self.reminders = [r for r in self.reminders if r.reminder_id != reminder.reminder_id]
+            removed = {rid for rid in ids if self._by_id.pop(rid, None) is not None}
+            if removed:
+                self.reminders = [r for r in self.reminders if r.reminder_id not in removed]
         except Exception as e:
-            error_logger.error(f"Error removing reminder {reminder.reminder_id}: {e}", exc_info=True)
+            error_logger.error(f"Error removing reminders {ids}: {e}", exc_info=True)
             raise
 
+    def delete_all_for_chat(self, chat_id):
+        """Remove every reminder of a chat in one transaction; returns the removed reminders"""
+        with self.transaction():
+            self.conn.execute('DELETE FROM reminders WHERE chat_id = ?', (chat_id,))
+        removed = [r for r in self.reminders if r.chat_id == chat_id]
+        self.reminders = [r for r in self.reminders if r.chat_id != chat_id]
+        for r in removed:
+            self._by_id.pop(r.reminder_id, None)
+        return removed
+
     # Add an alias for backward compatibility if needed
     delete_reminder = remove_reminder
 
@@ -266,7 +395,7 @@ class ReminderManager:
         Return both the clean task text and the extracted time text.
         """
         # Look for the last occurrence of time-related patterns
-        delay_pattern = re.search(r'(.*?)\s+in\s+\d+\s*(?:seconds?|secs?|s|minutes?|mins?|m|hours?|hrs?|h|days?|d|weeks?|w|months?|month)\s*$', text, re.IGNORECASE)
+        delay_pattern = _TRAILING_DELAY_RE.search(text)
         
         if delay_pattern:
             # Take everything before the last "in X units" as the task
@@ -276,46 +405,31 @@ class ReminderManager:
             return task, time_expr
 
         # Special case for first/last day of month patterns
-        first_day_pattern = re.search(r'(.*?)(?:at the first|on the first|on first|first of|first day of|at the first day of)(?:.*)', text, re.IGNORECASE)
+        first_day_pattern = _FIRST_DAY_RE.search(text)
         if first_day_pattern and first_day_pattern.group(1).strip():
             task = first_day_pattern.group(1).strip()
             time_expr = text[len(task):].strip()
             return task, time_expr
             
-        last_day_pattern = re.search(r'(.*?)(?:at the last|on the last|on last|last day of|at the last day of)(?:.*)', text, re.IGNORECASE)
+        last_day_pattern = _LAST_DAY_RE.search(text)
         if last_day_pattern and last_day_pattern.group(1).strip():
             task = last_day_pattern.group(1).strip()
             time_expr = text[len(task):].strip()
             return task, time_expr
             
         # Special case for "tomorrow" patterns
-        tomorrow_pattern = re.search(r'(.*?)\btomorrow\b(?:.*)', text, re.IGNORECASE)
+        tomorrow_pattern = _TOMORROW_RE.search(text)
         if tomorrow_pattern and tomorrow_pattern.group(1).strip():
             task = tomorrow_pattern.group(1).strip()
             time_expr = text[len(task):].strip()
             return task, time_expr
         
-        # Time-related patterns - use regex with word boundaries to avoid partial matches
-        time_patterns = [
-            r'\bevery day\b', r'\bdaily\b', r'\beveryday\b',
-            r'\bevery week\b', r'\bweekly\b',
-            r'\bevery month\b', r'\bmonthly\b',
-            r'\bevery second\b',
-            r'\bin \d+ (seconds?|secs?|s|minutes?|mins?|m|hours?|hrs?|h|days?|d|weeks?|w|months?|month)\b',
-            r'\bat \d{1,2}:\d{2}\b',
-            r'\bat \d{1,2}\s*(am|pm)\b',  # at 11 PM
-            r'\btomorrow at\b', r'\btomorrow\b', r'\bnext week\b', r'\bnext month\b',
-            r'\bon [a-zA-Z]+ \d+\b', r'\bon [a-zA-Z]+\b',  # On Monday, On July 15
-            r'\bthe (first|last) day of (the|every) month\b',
-            r'\b(first|last) day of (the|every) month\b',
-        ]
-        
         # Try to find the task and time by looking for time patterns
         task = text
         time_expr = ""
         
-        for pattern in time_patterns:
-            match = re.search(pattern, text, re.IGNORECASE)
+        for pattern in _TIME_PATTERNS:
+            match = pattern.search(text)
             if match:
                 start = match.start()
                 # If we find a time pattern, assume everything before it is the task
@@ -341,25 +455,11 @@ class ReminderManager:
         logging.debug(f"Extracted task: '{task}', time expression: '{time_expr}'")
         
         # Extract frequency patterns
-        if any(pattern in txt_lower for pattern in ["every day", "daily", "everyday"]):
-            r['frequency'] = 'daily'
-        elif any(pattern in txt_lower for pattern in ["every week", "weekly"]):
-            r['frequency'] = 'weekly'
-        elif any(pattern in txt_lower for pattern in ["every month", "monthly"]):
-            r['frequency'] = 'monthly'
-        elif "every second" in txt_lower:
-            r['frequency'] = 'seconds'
-            
-        # Extract special date modifiers
-        if any(pattern in txt_lower for pattern in ['last day of every month', 'last day of month', 'the last day of the month']):
-            r['date_modifier'] = 'last day of every month'
-            r['frequency'] = 'monthly'
-        elif any(pattern in txt_lower for pattern in ['first day of every month', 'first of every month', 'the first day of the month']):
-            r['date_modifier'] = 'first day of every month' 
-            r['frequency'] = 'monthly'
+        # Extract frequency and special date modifiers
+        r['frequency'], r['date_modifier'] = parse_schedule(txt_lower)
             
         # Extract delay information (in X minutes/hours/days/weeks/months)
-        delay_match = re.search(r"in\s+(\d+)\s*(seconds?|secs?|s|minutes?|mins?|m|hours?|hrs?|h|days?|d|weeks?|w|months?|month)", txt_lower)
+        delay_match = _DELAY_RE.search(txt_lower)
         if delay_match:
             amt = int(delay_match.group(1))
             unit = delay_match.group(2).strip()
@@ -416,8 +516,8 @@ class ReminderManager:
                     
                     # --- Extract H:M from original expression BEFORE conversion ---
                     original_hour_minute = None
-                    time_match_hm = re.search(r'\bat\s+(\d{1,2}):(\d{2})\b', time_expr, re.IGNORECASE)
-                    time_match_ampm = re.search(r'\bat\s+(\d{1,2})\s*(am|pm)\b', time_expr, re.IGNORECASE)
+                    time_match_hm = _AT_HM_RE.search(time_expr)
+                    time_match_ampm = _AT_AMPM_RE.search(time_expr)
                     if time_match_hm:
                         original_hour_minute = (int(time_match_hm.group(1)), int(time_match_hm.group(2)))
                     elif time_match_ampm:
@@ -460,13 +560,13 @@ class ReminderManager:
             except Exception as e:
                 logging.debug(f"timefhuman parsing failed: {str(e)}")
                 # Fallback to regex parsing for specific time formats 
-                time_match = re.search(r'at\s+(\d{1,2}):(\d{2})', time_expr.lower())
+                time_match = _FALLBACK_HM_RE.search(time_expr.lower())
                 if time_match:
                     r['time'] = (int(time_match.group(1)), int(time_match.group(2)))
                     logging.debug(f"Regex extracted time: {r['time']}")
                 else:
                     # Try to match "at XX PM/AM" format
-                    am_pm_match = re.search(r'at\s+(\d{1,2})(?:\s*|\:00)?\s*(am|pm)', time_expr.lower())
+                    am_pm_match = _FALLBACK_AMPM_RE.search(time_expr.lower())
                     if am_pm_match:
                         hour = int(am_pm_match.group(1))
                         if am_pm_match.group(2) == 'pm' and hour < 12:
@@ -478,6 +578,74 @@ class ReminderManager:
             
         return r
 
+    def _compute_next_exec(self, parsed, now):
+        """Derive the first execution time of a reminder from parse() output"""
+        next_exec = None
+
+        # Use parsed datetime from timefhuman if available
+        if parsed.get('parsed_datetime'):
+            next_exec = parsed['parsed_datetime']
+            logging.debug(f"Using parsed_datetime: {next_exec}")
+            # Make sure it's in the future
+            if next_exec <= now:
+                # If it's a time-of-day without specific date, move to tomorrow
+                if parsed.get('time'):
+                    next_exec += _ONE_DAY
+                    logging.debug(f"Adjusted to tomorrow: {next_exec}")
+                else:
+                    next_exec = now + datetime.timedelta(minutes=5)
+                    logging.debug(f"Adjusted to 5 minutes from now: {next_exec}")
+
+        # If no parsed datetime, handle delay patterns
+        if not next_exec and parsed.get('delay'):
+            logging.debug(f"Processing delay: {parsed['delay']}")
+            m = _PARSED_DELAY_RE.match(parsed['delay'])
+            if m:
+                n, unit = int(m.group(1)), m.group(2)
+                logging.debug(f"Delay components: {n} {unit}")
+                # Normalize plural forms, then map to the timedelta/relativedelta argument
+                kwarg = _DELAY_UNIT_KWARGS.get(unit.rstrip('s'))
+                if kwarg == 'months':
+                    next_exec = now + relativedelta(months=+n)
+                elif kwarg:
+                    next_exec = now + datetime.timedelta(**{kwarg: n})
+                logging.debug(f"Calculated next_exec from delay: {next_exec}")
+
+        # Handle special date modifiers
+        if not next_exec and parsed.get('date_modifier'):
+            logging.debug(f"Processing date_modifier: {parsed['date_modifier']}")
+            time_tuple = parsed.get('time')
+            hour, minute = time_tuple if time_tuple is not None else (9, 0)
+            first_of_next_month = datetime.datetime(*_next_month_of(now.year, now.month), 1, hour, minute)
+            if parsed['date_modifier'] == 'last day of every month':
+                # Calculate the last day of the current month
+                next_exec = KYIV_TZ.localize(first_of_next_month - _ONE_DAY)
+            elif parsed['date_modifier'] == 'first day of every month':
+                # Calculate first day of next month, at the specified time or 9 AM
+                next_exec = KYIV_TZ.localize(first_of_next_month)
+                logging.debug(f"Calculated first day of month: {next_exec}")
+
+        # If still no next_exec but we have time, use that for today or tomorrow
+        if not next_exec and parsed.get('time'):
+            h, mnt = parsed['time']
+            logging.debug(f"Using time component: {h}:{mnt}")
+            next_exec = now.replace(hour=h, minute=mnt, second=0, microsecond=0)
+            if next_exec <= now:
+                next_exec += _ONE_DAY
+                logging.debug(f"Time is in the past, adjusted to tomorrow: {next_exec}")
+
+        # Default to tomorrow morning if nothing else is specified
+        if not next_exec:
+            logging.debug("No time information extracted, using default (tomorrow 9 AM)")
+            next_exec = now.replace(hour=9, minute=0, second=0, microsecond=0)
+            if next_exec <= now:
+                next_exec += _ONE_DAY
+
+        is_one_time = not parsed['frequency'] and not parsed['date_modifier']
+        if is_one_time and next_exec <= now:
+            next_exec = now + datetime.timedelta(minutes=5)
+        return next_exec
+
     async def remind(self, update: Update, context: CallbackContext):
         args = context.args or []
         if not args:
@@ -487,180 +655,34 @@ class ReminderManager:
         command = args[0].lower()
         chat_id = update.effective_chat.id
         user_id = update.effective_user.id
+        # One clock reading per command, shared by parsing and scheduling below
+        now = datetime.datetime.now(KYIV_TZ)
 
         if command == "to":
             reminder_text = " ".join(args[1:])
             parsed = self.parse(reminder_text)
-            # derive next_execution
-            now = datetime.datetime.now(KYIV_TZ)
-            next_exec = None
-
-            # Use parsed datetime from timefhuman if available
-            if 'parsed_datetime' in parsed and parsed['parsed_datetime']:
-                next_exec = parsed['parsed_datetime']
-                logging.debug(f"Using parsed_datetime: {next_exec}")
-                # Make sure it's in the future
-                if next_exec <= now:
-                    # If it's a time-of-day without specific date, move to tomorrow
-                    if 'time' in parsed and parsed['time']:
-                        # Create a new datetime object with the same time but 1 day later
-                        next_exec = datetime.datetime(
-                            next_exec.year,
-                            next_exec.month,
-                            next_exec.day + 1,
-                            next_exec.hour,
-                            next_exec.minute,
-                            next_exec.second,
-                            tzinfo=next_exec.tzinfo
-                        )
-                        logging.debug(f"Adjusted to tomorrow: {next_exec}")
-                    else:
-                        next_exec = now + datetime.timedelta(minutes=5)
-                        logging.debug(f"Adjusted to 5 minutes from now: {next_exec}")
-            
-            # If no parsed datetime, handle delay patterns
-            if not next_exec and parsed.get('delay'):
-                logging.debug(f"Processing delay: {parsed['delay']}")
-                m = re.match(r'in\s+(\d+)\s+(\w+)', parsed['delay'])
-                if m:
-                    n, unit = int(m.group(1)), m.group(2)
-                    logging.debug(f"Delay components: {n} {unit}")
-                    
-                    # Normalize the unit to handle variations
-                    unit_normalized = unit.rstrip('s')  # Remove trailing 's' to handle plural forms
-                    
-                    # Special case for "month" to ensure it's not confused with "minute"
-                    if unit.strip() == 'month' or unit.strip() == 'months':
-                        unit_normalized = 'month'
-                    
-                    # Ensure now is timezone-aware
-                    if now.tzinfo is None:
-                        now = KYIV_TZ.localize(now)
-                    
-                    if unit_normalized == 'second' or unit_normalized in ['sec', 's']:
-                        next_exec = now + datetime.timedelta(seconds=n)
-                    elif unit_normalized == 'minute' or unit_normalized in ['min', 'm']:
-                        next_exec = now + datetime.timedelta(minutes=n)
-                    elif unit_normalized == 'hour' or unit_normalized in ['hr', 'h']:
-                        next_exec = now + datetime.timedelta(hours=n)
-                    elif unit_normalized == 'day' or unit_normalized == 'd':
-                        # Ensure now has timezone info
-                        general_logger.debug(f"Adding {n} days to now: {now}")
-                        if now.tzinfo is None:
-                            now = KYIV_TZ.localize(now)
-                        # Use timedelta to add days to the timezone-aware datetime
-                        next_exec = now + datetime.timedelta(days=n)
-                        general_logger.debug(f"Result after adding {n} days: {next_exec}")
-
-                    elif unit_normalized == 'week' or unit_normalized == 'w':
-                        # Ensure now has timezone info
-                        if now.tzinfo is None:
-                            now = KYIV_TZ.localize(now)
-                        # Use timedelta to add weeks to the timezone-aware datetime
-                        next_exec = now + datetime.timedelta(weeks=n)
-                    elif unit_normalized == 'month':
-                        # Ensure now has timezone info
-                        if now.tzinfo is None:
-                            now = KYIV_TZ.localize(now)
-                        # Use relativedelta to add months to the timezone-aware datetime
-                        next_exec = now + relativedelta(months=+n)
-                    
-                    # Ensure the result is timezone-aware
-                    if next_exec.tzinfo is None:
-                        next_exec = KYIV_TZ.localize(next_exec)
-                    
-                    logging.debug(f"Calculated next_exec from delay: {next_exec}")
-
-            # Handle special date modifiers
-            if not next_exec and parsed.get('date_modifier'):
-                logging.debug(f"Processing date_modifier: {parsed['date_modifier']}")
-                if parsed['date_modifier'] == 'last day of every month':
-                    # Calculate the last day of the current month
-                    if now.month == 12:
-                        last_day = datetime.datetime(now.year + 1, 1, 1, tzinfo=KYIV_TZ) - datetime.timedelta(days=1)
-                        time_tuple = parsed.get('time')
-                        hour, minute = time_tuple if time_tuple is not None else (9, 0)
-                        next_exec = last_day.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    else:
-                        last_day = datetime.datetime(now.year, now.month + 1, 1, tzinfo=KYIV_TZ) - datetime.timedelta(days=1)
-                        time_tuple = parsed.get('time')
-                        hour, minute = time_tuple if time_tuple is not None else (9, 0)
-                        next_exec = last_day.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                
-                elif parsed['date_modifier'] == 'first day of every month':
-                    # Calculate first day of next month
-                    if now.month == 12:
-                        first_day = datetime.datetime(now.year + 1, 1, 1, tzinfo=KYIV_TZ)
-                    else:
-                        first_day = datetime.datetime(now.year, now.month + 1, 1, tzinfo=KYIV_TZ)
-                    
-                    # Use the specified time or default to 9 AM
-                    time_tuple = parsed.get('time')
-                    hour, minute = time_tuple if time_tuple is not None else (9, 0)
-                    next_exec = first_day.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    logging.debug(f"Calculated first day of month: {next_exec}")
-
-            # If still no next_exec but we have time, use that for today or tomorrow
-            if not next_exec and parsed.get('time'):
-                h, mnt = parsed['time']
-                logging.debug(f"Using time component: {h}:{mnt}")
-                tmp = now.replace(hour=h, minute=mnt, second=0, microsecond=0)
-                if tmp <= now:
-                    # Create a new datetime object with the same time but 1 day later
-                    tmp = datetime.datetime(
-                        tmp.year,
-                        tmp.month,
-                        tmp.day + 1,
-                        tmp.hour,
-                        tmp.minute,
-                        tmp.second,
-                        tzinfo=tmp.tzinfo
-                    )
-                    logging.debug(f"Time is in the past, adjusted to tomorrow: {tmp}")
-                next_exec = tmp
-
-            # Default to tomorrow morning if nothing else is specified
-            if not next_exec:
-                logging.debug("No time information extracted, using default (tomorrow 9 AM)")
-                tmp = now.replace(hour=9, minute=0, second=0, microsecond=0)
-                if tmp <= now:
-                    # Create a new datetime object with the same time but 1 day later
-                    tmp = datetime.datetime(
-                        tmp.year,
-                        tmp.month,
-                        tmp.day + 1,
-                        tmp.hour,
-                        tmp.minute,
-                        tmp.second,
-                        tzinfo=tmp.tzinfo
-                    )
-                next_exec = tmp
-
-            is_one_time = not parsed['frequency'] and not parsed['date_modifier']
-            if is_one_time and next_exec <= now:
-                next_exec = now + datetime.timedelta(minutes=5)
+            next_exec = self._compute_next_exec(parsed, now)
 
             rem = Reminder(parsed['task'], parsed['frequency'], parsed['delay'],
                            parsed['date_modifier'], next_exec, user_id, chat_id,
                            update.effective_user.mention_markdown_v2())
             rem = self.save_reminder(rem)
 
-            delay_sec = seconds_until(rem.next_execution)
+            delay_sec = seconds_until(rem.next_execution, now)
             context.job_queue.run_once(self.send_reminder, delay_sec, data=rem, name=f"reminder_{rem.reminder_id}")
 
             # Ensure the displayed time is in the KYIV_TZ timezone
             if next_exec.tzinfo is None:
                 next_exec = KYIV_TZ.localize(next_exec)
             kyiv_time = next_exec.astimezone(KYIV_TZ)
-            await update.message.reply_text(f"✅ Reminder set for {kyiv_time.strftime('%d.%m.%Y %H:%M')}.")
+            await update.message.reply_text(f"✅ Reminder set for {kyiv_time.strftime(_DISPLAY_TIME_FORMAT)}.")
 
         elif command == "list":
-            rems = [r for r in self.load_reminders() if r.chat_id == chat_id]
+            rems = self.load_reminders(chat_id)
             if not rems:
                 await update.message.reply_text("No active reminders.")
                 return
-            s = ''
-            now = datetime.datetime.now(KYIV_TZ)
+            lines = []
             for r in rems:
                 # Ensure the displayed time is in the KYIV_TZ timezone
                 if r.next_execution:
@@ -669,13 +691,13 @@ class ReminderManager:
                     else:
                         next_exec = r.next_execution
                     kyiv_time = next_exec.astimezone(KYIV_TZ)
-                    due = kyiv_time.strftime('%d.%m.%Y %H:%M')
+                    due = kyiv_time.strftime(_DISPLAY_TIME_FORMAT)
                 else:
                     due = 'None'
                 kind = r.frequency or 'one-time'
                 status = 'past' if r.next_execution and r.next_execution < now else ''
-                s += f"ID:{r.reminder_id} | {due} | {kind} {status}\n{r.task}\n\n"
-            await update.message.reply_text(s)
+                lines.append(f"ID:{r.reminder_id} | {due} | {kind} {status}\n{r.task}")
+            await update.message.reply_text("\n\n".join(lines))
 
         elif command == "delete":
             if len(args) < 2:
@@ -683,19 +705,21 @@ class ReminderManager:
                 return
             what = args[1].lower()
             if what == 'all':
-                chat_rems = [r for r in self.reminders if r.chat_id == chat_id]
-                for r in chat_rems: self.delete_reminder(r)
+                for r in self.delete_all_for_chat(chat_id):
+                    for job in context.job_queue.get_jobs_by_name(f"reminder_{r.reminder_id}"):
+                        job.schedule_removal()
                 await update.message.reply_text("Deleted all reminders.")
             else:
                 try:
                     rid = int(what)
-                    rem = next((r for r in self.reminders if r.reminder_id == rid and r.chat_id == chat_id), None)
-                    if rem:
-                        self.delete_reminder(rem)
-                        await update.message.reply_text(f"Deleted reminder {rid}")
-                    else:
-                        await update.message.reply_text("Invalid ID.")
-                except:
+                except ValueError:
+                    await update.message.reply_text("Invalid ID.")
+                    return
+                rem = self._by_id.get(rid)
+                if rem and rem.chat_id == chat_id:
+                    self.delete_reminder(rem)
+                    await update.message.reply_text(f"Deleted reminder {rid}")
+                else:
                     await update.message.reply_text("Invalid ID.")
 
         elif command == "edit":
@@ -704,152 +728,17 @@ class ReminderManager:
                 return
             try:
                 rid = int(args[1])
-            except:
+            except ValueError:
                 await update.message.reply_text("Invalid ID.")
                 return
-            rem = next((r for r in self.load_reminders() if r.reminder_id==rid and r.chat_id==chat_id), None)
-            if not rem:
+            rem = self._by_id.get(rid)
+            if not rem or rem.chat_id != chat_id:
                 await update.message.reply_text("Reminder not found.")
                 return
 
             new_txt = " ".join(args[2:])
             parsed = self.parse(new_txt)
-            now = datetime.datetime.now(KYIV_TZ)
-            next_exec = None
-
-            # Use parsed datetime from timefhuman if available
-            if 'parsed_datetime' in parsed and parsed['parsed_datetime']:
-                next_exec = parsed['parsed_datetime']
-                logging.debug(f"Edit: Using parsed_datetime: {next_exec}")
-                # Make sure it's in the future
-                if next_exec <= now:
-                    # If it's a time-of-day without specific date, move to tomorrow
-                    if 'time' in parsed and parsed['time']:
-                        # Create a new datetime object with the same time but 1 day later
-                        next_exec = datetime.datetime(
-                            next_exec.year,
-                            next_exec.month,
-                            next_exec.day + 1,
-                            next_exec.hour,
-                            next_exec.minute,
-                            next_exec.second,
-                            tzinfo=next_exec.tzinfo
-                        )
-                        logging.debug(f"Edit: Adjusted to tomorrow: {next_exec}")
-                    else:
-                        next_exec = now + datetime.timedelta(minutes=5)
-                        logging.debug(f"Edit: Adjusted to 5 minutes from now: {next_exec}")
-                        
-            # Process delay pattern if no datetime from timefhuman
-            if not next_exec and parsed.get('delay'):
-                logging.debug(f"Edit: Processing delay: {parsed['delay']}")
-                m = re.match(r'in\s+(\d+)\s+(\w+)', parsed['delay'])
-                if m:
-                    n, unit = int(m.group(1)), m.group(2)
-                    logging.debug(f"Edit: Delay components: {n} {unit}")
-                    
-                    # Normalize the unit to handle variations
-                    unit_normalized = unit.rstrip('s')  # Remove trailing 's' to handle plural forms
-                    
-                    # Special case for "month" to ensure it's not confused with "minute"
-                    if unit.strip() == 'month' or unit.strip() == 'months':
-                        unit_normalized = 'month'
-                    
-                    # Ensure now is timezone-aware
-                    if now.tzinfo is None:
-                        now = KYIV_TZ.localize(now)
-                    
-                    if unit_normalized == 'second' or unit_normalized in ['sec', 's']:
-                        next_exec = now + datetime.timedelta(seconds=n)
-                    elif unit_normalized == 'minute' or unit_normalized in ['min', 'm']:
-                        next_exec = now + datetime.timedelta(minutes=n)
-                    elif unit_normalized == 'hour' or unit_normalized in ['hr', 'h']:
-                        next_exec = now + datetime.timedelta(hours=n)
-                    elif unit_normalized == 'day' or unit_normalized == 'd':
-                        # Ensure now has timezone info
-                        general_logger.debug(f"Edit: Adding {n} days to now: {now}")
-                        if now.tzinfo is None:
-                            now = KYIV_TZ.localize(now)
-                        # Use timedelta to add days to the timezone-aware datetime
-                        next_exec = now + datetime.timedelta(days=n)
-                        general_logger.debug(f"Edit: Result after adding {n} days: {next_exec}")
-                    elif unit_normalized == 'week' or unit_normalized == 'w':
-                        next_exec = now + datetime.timedelta(weeks=n)
-                    elif unit_normalized == 'month':
-                        next_exec = now + relativedelta(months=+n)
-                    
-                    # Ensure the result is timezone-aware
-                    if next_exec.tzinfo is None:
-                        next_exec = KYIV_TZ.localize(next_exec)
-                    
-                    logging.debug(f"Edit: Calculated next_exec from delay: {next_exec}")
-
-            # Handle special date modifiers
-            if not next_exec and parsed.get('date_modifier'):
-                logging.debug(f"Edit: Processing date_modifier: {parsed['date_modifier']}")
-                if parsed['date_modifier'] == 'last day of every month':
-                    # Calculate the last day of the current month
-                    if now.month == 12:
-                        last_day = datetime.datetime(now.year + 1, 1, 1, tzinfo=KYIV_TZ) - datetime.timedelta(days=1)
-                        time_tuple = parsed.get('time')
-                        hour, minute = time_tuple if time_tuple is not None else (9, 0)
-                        next_exec = last_day.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    else:
-                        last_day = datetime.datetime(now.year, now.month + 1, 1, tzinfo=KYIV_TZ) - datetime.timedelta(days=1)
-                        time_tuple = parsed.get('time')
-                        hour, minute = time_tuple if time_tuple is not None else (9, 0)
-                        next_exec = last_day.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    
-                elif parsed['date_modifier'] == 'first day of every month':
-                    # Calculate the first day of the next month
-                    if now.month == 12:
-                        first_day = datetime.datetime(now.year + 1, 1, 1, tzinfo=KYIV_TZ)
-                    else:
-                        first_day = datetime.datetime(now.year, now.month + 1, 1, tzinfo=KYIV_TZ)
-                    
-                    # Use the specified time or default to 9 AM
-                    time_tuple = parsed.get('time')
-                    hour, minute = time_tuple if time_tuple is not None else (9, 0)
-                    next_exec = first_day.replace(hour=hour, minute=minute, second=0, microsecond=0)
-                    logging.debug(f"Edit: Calculated first day of month: {next_exec}")
-
-            if not next_exec and parsed.get('time'):
-                h, mnt = parsed['time']
-                logging.debug(f"Edit: Using time component: {h}:{mnt}")
-                tmp = now.replace(hour=h, minute=mnt, second=0, microsecond=0)
-                if tmp <= now:
-                    # Create a new datetime object with the same time but 1 day later
-                    tmp = datetime.datetime(
-                        tmp.year,
-                        tmp.month,
-                        tmp.day + 1,
-                        tmp.hour,
-                        tmp.minute,
-                        tmp.second,
-                        tzinfo=tmp.tzinfo
-                    )
-                    logging.debug(f"Edit: Time is in the past, adjusted to tomorrow: {tmp}")
-                next_exec = tmp
-
-            if not next_exec:
-                logging.debug("Edit: No time information extracted, using default (tomorrow 9 AM)")
-                tmp = now.replace(hour=9, minute=0, second=0, microsecond=0)
-                if tmp <= now:
-                    # Create a new datetime object with the same time but 1 day later
-                    tmp = datetime.datetime(
-                        tmp.year,
-                        tmp.month,
-                        tmp.day + 1,
-                        tmp.hour,
-                        tmp.minute,
-                        tmp.second,
-                        tzinfo=tmp.tzinfo
-                    )
-                next_exec = tmp
-
-            is_one_time = not parsed['frequency'] and not parsed['date_modifier']
-            if is_one_time and next_exec <= now:
-                next_exec = now + datetime.timedelta(minutes=5)
+            next_exec = self._compute_next_exec(parsed, now)
 
             rem.task = parsed['task']
             rem.frequency = parsed['frequency']
@@ -862,14 +751,14 @@ class ReminderManager:
             jobs = context.job_queue.get_jobs_by_name(f"reminder_{rem.reminder_id}")
             for j in jobs:
                 j.schedule_removal()
-            delay = seconds_until(rem.next_execution)
+            delay = seconds_until(rem.next_execution, now)
             context.job_queue.run_once(self.send_reminder, delay, data=rem, name=f"reminder_{rem.reminder_id}")
 
             # Ensure the displayed time is in the KYIV_TZ timezone
             if next_exec.tzinfo is None:
                 next_exec = KYIV_TZ.localize(next_exec)
             kyiv_time = next_exec.astimezone(KYIV_TZ)
-            await update.message.reply_text(f"Reminder updated. Next execution: {kyiv_time.strftime('%d.%m.%Y %H:%M')}.")
+            await update.message.reply_text(f"Reminder updated. Next execution: {kyiv_time.strftime(_DISPLAY_TIME_FORMAT)}.")
 
         else:
             await update.message.reply_text("Unknown /remind command.")
@@ -890,17 +779,23 @@ class ReminderManager:
             error_logger.error(f"Sending reminder failed: {e}")
 
         # handle recurring reschedule or delete
-        rem.calculate_next_execution()
+        now = datetime.datetime.now(KYIV_TZ)
+        rem.calculate_next_execution(now)
         if rem.frequency or rem.date_modifier:
-            self.save_reminder(rem)
-            delay = seconds_until(rem.next_execution)
+            self._update_next_execution(rem)
+            delay = seconds_until(rem.next_execution, now)
             context.job_queue.run_once(self.send_reminder, delay, data=rem, name=f"reminder_{rem.reminder_id}")
         else:
             self.delete_reminder(rem)
 
     def schedule_startup(self, job_queue):
         now = datetime.datetime.now(KYIV_TZ)
-        for rem in self.load_reminders():
-            if rem.next_execution and rem.next_execution > now:
-                delay = seconds_until(rem.next_execution)
-                job_queue.run_once(self.send_reminder, delay, data=rem, name=f"reminder_{rem.reminder_id}")
+        rows = self.conn.execute(
+            'SELECT reminder_id FROM reminders WHERE next_execution > ? ORDER BY next_execution',
+            (to_epoch_us(now),))
+        for (rid,) in rows:
+            rem = self._by_id.get(rid)
+            if rem is None:
+                continue
+            delay = seconds_until(rem.next_execution, now)
+            job_queue.run_once(self.send_reminder, delay, data=rem, name=f"reminder_{rem.reminder_id}")
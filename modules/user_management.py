@@ -1,4 +1,3 @@
-import pytz
 import random
 from datetime import datetime, timedelta
 from typing import Optional
@@ -7,10 +6,11 @@ from telegram import Update, ChatPermissions
 from telegram.ext import CallbackContext
 from telegram.error import TelegramError
 
+from modules.const import KYIV_TZ
 from modules.logger import general_logger, error_logger
 
 # Constants
-LOCAL_TZ = pytz.timezone('Europe/Kyiv')
+LOCAL_TZ = KYIV_TZ
 RESTRICT_DURATION_RANGE = (1, 15)  # min and max minutes
 RESTRICTION_STICKER = [
     "CAACAgQAAxkBAAEt8tNm9Wc6jYEQdAgQzvC917u3e8EKPgAC9hQAAtMUCVP4rJSNEWepBzYE",
@@ -18,6 +18,10 @@ RESTRICTION_STICKER = [
     "CAACAgIAAxkBAAEyoTBn0vAKKx5B8fDNzKVD1WDD3A4SzgACJSsAArOEUEpDLeMUdNLVODYE",
     "CAACAgIAAxkBAAEy4j9n3TOZf_YFKs9TdUCb9d3sNvVwbwAC32YAAvgziEr0xAPmmKNIFDYE"
 ]
+# Built once; ChatPermissions objects are immutable and safe to share between calls.
+# Omitted permissions already default to False in the Bot API, and can_send_media_messages
+# is no longer accepted by newer python-telegram-bot releases.
+MUTE_PERMISSIONS = ChatPermissions.no_permissions()
 
 async def restrict_user(update: Update, context: CallbackContext) -> None:
     """
@@ -48,13 +52,12 @@ async def restrict_user(update: Update, context: CallbackContext) -> None:
         restrict_duration = random.randint(*RESTRICT_DURATION_RANGE)
         until_date = datetime.now(LOCAL_TZ) + timedelta(minutes=restrict_duration)
         until_date_formatted = until_date.strftime("%Y-%m-%d %H:%M:%S")
-        permissions = ChatPermissions(can_send_messages=False, can_send_media_messages=False)
 
         # Apply restriction
         await context.bot.restrict_chat_member(
             chat_id=chat.id,
             user_id=user.id,
-            permissions=permissions,
+            permissions=MUTE_PERMISSIONS,
             until_date=until_date
         )
 
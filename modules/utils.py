@@ -5,8 +5,10 @@ import os
 import asyncio
 import aiohttp
 import csv
+import bisect
+from collections import OrderedDict
 from datetime import datetime, time as dt_time, timedelta
-from typing import Optional, List
+from typing import Optional, List, Dict
 import logging
 
 from telegram import Update
@@ -15,7 +17,7 @@ from telegram.ext import CallbackContext
 from modules.logger import error_logger, LOG_DIR, general_logger
 from modules.const import (
     weather_emojis, city_translations, feels_like_emojis,
-    SCREENSHOT_DIR, DATA_DIR, LOG_DIR, DOWNLOADS_DIR
+    SCREENSHOT_DIR, DATA_DIR, LOG_DIR, DOWNLOADS_DIR, KYIV_TZ
 )
 import modules.file_manager as file_manager
 
@@ -39,14 +41,23 @@ IMGKIT_OPTIONS = {
 }
 
 class MessageCounter:
-    """Manages message counts per chat for random GPT responses."""
+    """Manages message counts per chat for random GPT responses.
+
+    Counts are capped and only the most recently active chats are kept, so memory stays bounded.
+    """
+    MAX_CHATS = 10_000
+    MAX_COUNT = 1_000_000
+
     def __init__(self):
-        self.counts = {}
+        self.counts: "OrderedDict[int, int]" = OrderedDict()
 
     def increment(self, chat_id: int) -> int:
         """Increment message count for a chat and return new count."""
-        self.counts[chat_id] = self.counts.get(chat_id, 0) + 1
-        return self.counts[chat_id]
+        count = min(self.counts.pop(chat_id, 0) + 1, self.MAX_COUNT)
+        self.counts[chat_id] = count
+        if len(self.counts) > self.MAX_CHATS:
+            self.counts.popitem(last=False)
+        return count
 
     def reset(self, chat_id: int) -> None:
         """Reset message count for a chat."""
@@ -69,6 +80,10 @@ def init_directories() -> None:
         ensure_directory(directory)
 
 # Text processing utilities
+# Compiled once at import; both are only run when the text can contain a URL at all
+URL_PATTERN = re.compile(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+')
+LINK_PATTERN = re.compile(r'http[s]?://\S+')
+
 def remove_links(text: str) -> str:
     """
     Remove all URLs from the given text.
@@ -79,7 +94,24 @@ def remove_links(text: str) -> str:
     Returns:
         str: Text with URLs removed
     """
-    return re.sub(r'http[s]?://\S+', '', text).strip()
+    if '://' not in text:
+        return text.strip()
+    return LINK_PATTERN.sub('', text).strip()
+
+# Characters Telegram requires escaping in MarkdownV2 text, mapped once for str.translate
+_MARKDOWN_V2_ESCAPES = str.maketrans({char: f'\\{char}' for char in '\\_*[]()~`>#+-=|{}.!'})
+
+def escape_markdown_v2(text: str) -> str:
+    """
+    Escape MarkdownV2 special characters in a single pass.
+    
+    Args:
+        text: Text to escape
+        
+    Returns:
+        str: Text safe to embed in a MarkdownV2 message
+    """
+    return text.translate(_MARKDOWN_V2_ESCAPES)
 
 def extract_urls(text: str) -> List[str]:
     """
@@ -91,8 +123,9 @@ def extract_urls(text: str) -> List[str]:
     Returns:
         List[str]: List of URLs found in the text
     """
-    url_pattern = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
-    return re.findall(url_pattern, text)
+    if '://' not in text:
+        return []
+    return URL_PATTERN.findall(text)
 
 # Weather-related utilities
 def country_code_to_emoji(country_code: str) -> str:
@@ -107,6 +140,13 @@ def country_code_to_emoji(country_code: str) -> str:
     """
     return ''.join(chr(127397 + ord(c)) for c in country_code.upper())
 
+# Lookup tables derived from the range dicts in const, built once at import
+_WEATHER_EMOJI_BY_ID = {
+    weather_id: emoji for id_range, emoji in weather_emojis.items() for weather_id in id_range
+}
+_FEELS_LIKE_RANGES = sorted(feels_like_emojis.items(), key=lambda item: item[0].start)
+_FEELS_LIKE_STARTS = [temp_range.start for temp_range, _ in _FEELS_LIKE_RANGES]
+
 def get_weather_emoji(weather_id: int) -> str:
     """
     Get weather emoji based on weather ID.
@@ -117,8 +157,7 @@ def get_weather_emoji(weather_id: int) -> str:
     Returns:
         str: Appropriate emoji for the weather condition
     """
-    return next((emoji for id_range, emoji in weather_emojis.items()
-                if weather_id in id_range), '🌈')
+    return _WEATHER_EMOJI_BY_ID.get(weather_id, '🌈')
 
 def get_feels_like_emoji(feels_like: float) -> str:
     """
@@ -130,8 +169,10 @@ def get_feels_like_emoji(feels_like: float) -> str:
     Returns:
         str: Appropriate emoji for the temperature
     """
-    for temp_range, emoji in feels_like_emojis.items():
-        if feels_like >= temp_range.start and feels_like < temp_range.stop:
+    index = bisect.bisect_right(_FEELS_LIKE_STARTS, feels_like) - 1
+    if index >= 0:
+        temp_range, emoji = _FEELS_LIKE_RANGES[index]
+        if feels_like < temp_range.stop:
             return emoji
     return '🌈'
 
@@ -145,7 +186,7 @@ def get_city_translation(city: str) -> str:
     Returns:
         str: Translated city name or original if not found
     """
-    normalized = city.lower().replace(" ", "")
+    normalized = "".join(city.casefold().split())
     return city_translations.get(normalized, city)
 
 # get_last_used_city wrapper to use local CITY_DATA_FILE
@@ -199,9 +240,10 @@ class ScreenshotManager:
 
     def __init__(self):
         if not self._initialized:
-            self.timezone = pytz.timezone('Europe/Kyiv')
+            self.timezone = KYIV_TZ
             self.schedule_time = dt_time(2, 0)  # 2 AM Kyiv time
             self.config = imgkit.config(wkhtmltoimage=WKHTMLTOIMAGE_PATH)
+            self._capture_locks: Dict[str, asyncio.Lock] = {}
             self._initialized = True
 
     def get_screenshot_path(self) -> str:
@@ -227,24 +269,46 @@ class ScreenshotManager:
             return screenshot_path
         return None
 
-    async def take_screenshot(self, url: str, output_path: str) -> Optional[str]:
+    def _get_capture_lock(self, output_path: str) -> asyncio.Lock:
+        """
+        Get the lock serializing captures to the given path, dropping idle locks for older paths.
+        
+        Args:
+            output_path: Screenshot path the lock guards
+            
+        Returns:
+            asyncio.Lock: Lock for this path
+        """
+        lock = self._capture_locks.get(output_path)
+        if lock is None:
+            self._capture_locks = {
+                path: existing for path, existing in self._capture_locks.items() if existing.locked()
+            }
+            lock = self._capture_locks[output_path] = asyncio.Lock()
+        return lock
+
+    async def take_screenshot(self, url: str, output_path: str, reuse_existing: bool = False) -> Optional[str]:
         """
         Take a screenshot of the given URL and save it to the output path.
         
+        Only one capture per output path runs at a time; concurrent callers wait for it.
+        
         Args:
             url: URL to capture
             output_path: Path to save the screenshot
+            reuse_existing: Return an existing file at output_path instead of capturing again
             
         Returns:
             Optional[str]: Path to saved screenshot or None on failure
         """
         try:
-            # Run imgkit in a thread pool to avoid blocking
-            loop = asyncio.get_event_loop()
-            await loop.run_in_executor(
-                None, 
-                lambda: imgkit.from_url(url, output_path, options=IMGKIT_OPTIONS, config=self.config)
-            )
+            async with self._get_capture_lock(output_path):
+                if reuse_existing and os.path.exists(output_path):
+                    return output_path
+                # Run imgkit in a worker thread to avoid blocking
+                await asyncio.to_thread(
+                    imgkit.from_url, url, output_path, options=IMGKIT_OPTIONS, config=self.config
+                )
             return output_path
         except Exception as e:
             error_logger.error(f"Error taking screenshot: {str(e)}")
@@ -297,22 +361,23 @@ async def screenshot_command(update: Update, context: CallbackContext) -> None:
         screenshot_path = manager.get_latest_screenshot()
 
         # Get current time in Kyiv timezone
-        kyiv_now = datetime.now(pytz.timezone('Europe/Kyiv'))
+        kyiv_now = datetime.now(KYIV_TZ)
         next_screenshot = kyiv_now + timedelta(hours=6)
 
         # If no screenshot exists for today, take a new one
         if not screenshot_path:
             status_msg = await update.message.reply_text("Роблю новий знімок, будь ласка зачекайте...")
+            # Concurrent requests share a single capture for today's path
             screenshot_path = await manager.take_screenshot(
-            WEATHER_API_URL,
-            manager.get_screenshot_path()
+                WEATHER_API_URL,
+                manager.get_screenshot_path(),
+                reuse_existing=True
             )
             await status_msg.delete()
 
         if screenshot_path:
             # Get file modification time
-            mod_time = datetime.fromtimestamp(os.path.getmtime(screenshot_path))
-            mod_time = mod_time.astimezone(pytz.timezone('Europe/Kyiv'))
+            mod_time = datetime.fromtimestamp(os.path.getmtime(screenshot_path), KYIV_TZ)
             
             caption = (
                 f"Прогноз сонячних спалахів і магнітних бурь\n"
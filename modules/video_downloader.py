@@ -11,9 +11,9 @@ from asyncio import Lock
 from dataclasses import dataclass
 from enum import Enum
 from telegram import Update
-from telegram.ext import ContextTypes, MessageHandler, filters
+from telegram.ext import ContextTypes
 from modules.const import VideoPlatforms
-from modules.utils import extract_urls
+from modules.utils import extract_urls, escape_markdown_v2
 from modules.logger import init_error_handler, error_logger
 from dotenv import load_dotenv
 
@@ -424,14 +424,18 @@ class VideoDownloader:
             )
             await update.message.reply_text("❌ An error occurred.")
 
-    async def handle_video_link(self, update: Update, context: ContextTypes.DEFAULT_TYPE) -> None:
-        """Handle video link with improved error handling and resource cleanup."""
+    async def handle_video_link(self, update: Update, context: ContextTypes.DEFAULT_TYPE, urls: Optional[List[str]] = None) -> None:
+        """Handle video link with improved error handling and resource cleanup.
+
+        Callers that have already scanned the message pass ``urls`` to skip re-extracting them.
+        """
         processing_msg = None
         filename = None
 
         try:
             message_text = update.message.text.strip()
-            urls = self.extract_urls(message_text)
+            if urls is None:
+                urls = self.extract_urls(message_text)
             
             if not urls:
                 await self.send_error_sticker(update)
@@ -462,19 +466,10 @@ class VideoDownloader:
                 return
 
             # Escape all special characters for Markdown V2
-            special_chars = ['_', '*', '[', ']', '(', ')', '~', '`', '>', '#', '+', '-', '=', '|', '{', '}', '.', '!']
-            escaped_title = title
-            for char in special_chars:
-                escaped_title = escaped_title.replace(char, f'\\{char}')
-
-            caption = f"📹 {escaped_title}"
+            caption = f"📹 {escape_markdown_v2(title)}"
             
             if source_url:
-                # Escape special characters in URL
-                escaped_url = source_url
-                for char in special_chars:
-                    escaped_url = escaped_url.replace(char, f'\\{char}')
-                caption += f"\n\n🔗 [Посилання]({escaped_url})"
+                caption += f"\n\n🔗 [Посилання]({escape_markdown_v2(source_url)})"
 
             with open(filename, 'rb') as video_file:
                 await update.message.reply_video(
@@ -762,11 +757,8 @@ def setup_video_handlers(application, extract_urls_func=None):
         extract_urls_func=extract_urls_func
     )
     
+    # Text messages are dispatched here from main.handle_message, which already
+    # owns the TEXT handler slot in group 0; registering a second one would never fire.
     application.bot_data['video_downloader'] = video_downloader
 
-    application.add_handler(MessageHandler(
-        filters.TEXT & filters.Regex('|'.join(VideoPlatforms.SUPPORTED_PLATFORMS)), 
-        video_downloader.handle_video_link
-    ))
-
     return video_downloader
\ No newline at end of file
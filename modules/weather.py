@@ -1,7 +1,9 @@
 """Weather module for fetching and displaying weather information."""
 
+import time
+from collections import OrderedDict
 from dataclasses import dataclass
-from typing import Optional
+from typing import Optional, Tuple
 import httpx
 from telegram import Update
 from telegram.ext import CallbackContext
@@ -18,6 +20,13 @@ from modules.logger import error_logger, general_logger
 from modules.file_manager import save_user_location
 from modules.gpt import ask_gpt_command
 
+# HTTP/2 needs the optional h2 package (httpx[http2]); fall back to HTTP/1.1 without it
+try:
+    import h2  # noqa: F401
+    HTTP2_AVAILABLE = True
+except ImportError:
+    HTTP2_AVAILABLE = False
+
 
 @dataclass
 class WeatherCommand:
@@ -78,40 +87,53 @@ class WeatherData:
                 clothing_advice=""
             )
 
-    async def format_message(self, update: Update = None, context: CallbackContext = None) -> str:
-        """Format weather data into a readable message."""
+    def format_summary(self) -> str:
+        """Format the weather data itself, without the GPT clothing advice."""
         weather_emoji = get_weather_emoji(self.weather_id)
         country_flag = country_code_to_emoji(self.country_code)
         feels_like_emoji = get_feels_like_emoji(self.feels_like)
-        
-        # Get clothing advice
-        clothing_advice = await self.get_clothing_advice(update, context)
 
         return (
             f"Погода в {self.city_name}, {self.country_code} {country_flag}:\n"
             f"{weather_emoji} {self.description.capitalize()}\n"
             f"🌡 Температура: {round(self.temperature)}°C\n"
             f"{feels_like_emoji} Відчувається як: {round(self.feels_like)}°C"
-            f"\n👕 {clothing_advice.clothing_advice}"
         )
 
 
 class WeatherAPI:
     """Handler for OpenWeatherMap API interactions."""
     
-    BASE_URL = "http://api.openweathermap.org/data/2.5/weather"
-    
+    BASE_URL = "https://api.openweathermap.org/data/2.5"
+    CACHE_TTL_SECONDS = 300
+    CACHE_MAX_ENTRIES = 128
+
     def __init__(self):
-        self.cache = {}
+        # translated city (casefolded) -> (monotonic fetch time, data), least recently used first
+        self.cache: "OrderedDict[str, Tuple[float, WeatherData]]" = OrderedDict()
         self.api_key = Config.OPENWEATHER_API_KEY
-        self.client = httpx.AsyncClient()
+        # One pooled client for the process: keep-alive connections to the API are reused,
+        # and over HTTP/2 concurrent requests share a single TLS connection
+        self.client = httpx.AsyncClient(
+            base_url=self.BASE_URL,
+            http2=HTTP2_AVAILABLE,
+            timeout=httpx.Timeout(5.0, connect=2.0),
+            limits=httpx.Limits(max_keepalive_connections=10, max_connections=20),
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self.client.aclose()
     
     async def fetch_weather(self, city: str) -> Optional[WeatherData]:
         """Fetch weather data from OpenWeatherMap API."""
-        if city in self.cache:
-            general_logger.info(f"Using cached weather data for {city}")
-            return self.cache[city]
         translated_city = get_city_translation(city)
+        key = translated_city.casefold()
+        cached = self.cache.get(key)
+        if cached is not None and time.monotonic() - cached[0] < self.CACHE_TTL_SECONDS:
+            self.cache.move_to_end(key)
+            general_logger.info(f"Using cached weather data for {city}")
+            return cached[1]
         general_logger.info(f"Fetching weather for city: {translated_city} (original: {city})")
         
         params = {
@@ -122,8 +144,7 @@ class WeatherAPI:
         }
         
         try:
-            # Use the client from initialization instead of creating new one
-            response = await self.client.get(self.BASE_URL, params=params)
+            response = await self.client.get("/weather", params=params)
             data = response.json()
 
             cod = data.get("cod")
@@ -148,7 +169,10 @@ class WeatherAPI:
                 feels_like=main.get("feels_like", 0)
             )
             
-            self.cache[city] = weather_data
+            self.cache[key] = (time.monotonic(), weather_data)
+            self.cache.move_to_end(key)
+            if len(self.cache) > self.CACHE_MAX_ENTRIES:
+                self.cache.popitem(last=False)
             return weather_data
         except httpx.RequestError as e:
             error_logger.error(f"Network or request error fetching weather data: {e}")
@@ -170,12 +194,20 @@ class WeatherCommandHandler:
     def __init__(self):
         self.weather_api = WeatherAPI()
     
-    async def handle_weather_request(self, city: str, update: Update = None, context: CallbackContext = None) -> str:
-        """Process weather request and return formatted message."""
-        weather_data = await self.weather_api.fetch_weather(city)
-        if weather_data:
-            return await weather_data.format_message(update, context)
-        return "Не вдалося отримати дані про погоду. "
+    async def handle_weather_request(self, city: str, update: Update = None, context: CallbackContext = None) -> Optional[WeatherData]:
+        """Process weather request and return the weather data, or None if it could not be fetched."""
+        return await self.weather_api.fetch_weather(city)
+
+    async def _append_clothing_advice(self, sent, weather_info: str, weather_data: WeatherData,
+                                      update: Update, context: CallbackContext) -> None:
+        """Edit the already sent weather reply to add GPT clothing advice."""
+        advice = await weather_data.get_clothing_advice(update, context)
+        if not advice.clothing_advice:
+            return
+        try:
+            await sent.edit_text(f"{weather_info}\n👕 {advice.clothing_advice}")
+        except Exception as e:
+            error_logger.error(f"Error adding clothing advice to weather message: {e}")
     
     async def __call__(self, update: Update, context: CallbackContext) -> None:
         """Handle /weather command."""
@@ -196,11 +228,20 @@ class WeatherCommandHandler:
                     )
                     return
             
-            # Get weather info and pass update, context parameters
-            weather_info = await self.handle_weather_request(city, update, context)
+            # Get weather data and pass update, context parameters
+            weather_data = await self.handle_weather_request(city, update, context)
             
             if update.message:
-                await update.message.reply_text(weather_info)
+                if weather_data is None:
+                    await update.message.reply_text("Не вдалося отримати дані про погоду. ")
+                    return
+                # Reply with the weather right away; the slow GPT advice is edited in afterwards
+                weather_info = weather_data.format_summary()
+                sent = await update.message.reply_text(weather_info)
+                context.application.create_task(
+                    self._append_clothing_advice(sent, weather_info, weather_data, update, context),
+                    update=update,
+                )
                 
         except httpx.HTTPStatusError as e:
             error_logger.error(f"HTTP status error in weather command: {e}")
@@ -0,0 +1,16 @@
+import os
+import sys
+
+import pytest
+
+# Make the project root importable once for the whole test session
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+
+@pytest.fixture(scope="session")
+def reminder_manager():
+    """One in-memory ReminderManager shared by the whole test session"""
+    from modules.reminders.reminders import ReminderManager
+    manager = ReminderManager(db_file=':memory:')
+    yield manager
+    manager.conn.close()
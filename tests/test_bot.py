@@ -1,6 +1,5 @@
 import unittest
 import os
-import sys
 import tempfile
 import csv
 import json
@@ -11,17 +10,15 @@ from unittest.mock import mock_open, patch, MagicMock, AsyncMock, call
 from telegram import Update
 from telegram.ext import CallbackContext
 
-# Add the project root to the Python path so we can import modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-
 from modules.utils import (
     extract_urls, ensure_directory, init_directories, 
     remove_links, country_code_to_emoji, get_weather_emoji,
-    get_feels_like_emoji, get_city_translation
+    get_feels_like_emoji, get_city_translation, MessageCounter,
+    escape_markdown_v2
 )
 from modules.file_manager import ensure_csv_headers, save_user_location
 from modules.utils import get_last_used_city
-from modules.weather import WeatherCommand, WeatherData, WeatherCommandHandler
+from modules.weather import WeatherCommand, WeatherData, WeatherCommandHandler, WeatherAPI
 from modules.const import weather_emojis, feels_like_emojis
 
 class TestBot(unittest.TestCase):
@@ -121,6 +118,24 @@ class TestBot(unittest.TestCase):
                     self.assertEqual(row[1], "Lviv")
                     self.assertEqual(row[3], "456")
 
+    def test_save_user_location_overwrites_and_compacts(self):
+        """Test that the latest save wins and superseded rows get compacted."""
+        from modules import file_manager
+        with tempfile.TemporaryDirectory() as temp_dir:
+            test_file = os.path.join(temp_dir, "test_compact.csv")
+            
+            with patch('modules.file_manager.CSV_FILE', test_file):
+                save_user_location(123, "Lviv", 456)
+                for i in range(file_manager.LOCATION_COMPACT_SLACK + 5):
+                    save_user_location(123, f"City{i}")
+                
+                self.assertEqual(file_manager.get_last_used_city(123), f"City{file_manager.LOCATION_COMPACT_SLACK + 4}")
+                self.assertEqual(file_manager.get_last_used_city(123, 456), "Lviv")
+                
+                with open(test_file, 'r', newline='', encoding='utf-8') as f:
+                    rows = list(csv.reader(f))[1:]
+                self.assertLess(len(rows), file_manager.LOCATION_COMPACT_SLACK + 6)
+
     def test_get_last_used_city_kiev_conversion(self):
         """Test that 'Kiev' is converted to 'Kyiv' when retrieved."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -196,7 +211,10 @@ class TestBot(unittest.TestCase):
         
         # Create WeatherCommandHandler instance with mocked handle_weather_request
         weather_cmd = WeatherCommandHandler()
-        weather_cmd.handle_weather_request = AsyncMock(return_value="Weather info for Kyiv")
+        weather_data = MagicMock()
+        weather_data.format_summary.return_value = "Weather info for Kyiv"
+        weather_cmd.handle_weather_request = AsyncMock(return_value=weather_data)
+        weather_cmd._append_clothing_advice = MagicMock()
         
         # Run the coroutine
         asyncio.run(weather_cmd(update, context))
@@ -226,7 +244,10 @@ class TestBot(unittest.TestCase):
         
         # Create WeatherCommandHandler instance with mocked handle_weather_request
         weather_cmd = WeatherCommandHandler()
-        weather_cmd.handle_weather_request = AsyncMock(return_value="Weather info for Odesa")
+        weather_data = MagicMock()
+        weather_data.format_summary.return_value = "Weather info for Odesa"
+        weather_cmd.handle_weather_request = AsyncMock(return_value=weather_data)
+        weather_cmd._append_clothing_advice = MagicMock()
         
         # Run the coroutine
         asyncio.run(weather_cmd(update, context))
@@ -237,6 +258,60 @@ class TestBot(unittest.TestCase):
         # Verify message was sent
         update.message.reply_text.assert_called_once_with("Weather info for Odesa")
 
+        # The fetched data object itself is handed to the clothing advice task
+        sent = update.message.reply_text.return_value
+        weather_cmd._append_clothing_advice.assert_called_once_with(
+            sent, "Weather info for Odesa", weather_data, update, context)
+
+    @patch('modules.weather.save_user_location')
+    def test_weather_command_fetch_failure(self, mock_save_location):
+        """A failed fetch replies with an error and schedules no clothing advice."""
+        import asyncio
+
+        update = MagicMock(spec=Update)
+        update.effective_user = MagicMock()
+        update.effective_user.id = 123
+        update.effective_chat = MagicMock()
+        update.effective_chat.id = 456
+        update.message = MagicMock()
+        update.message.reply_text = AsyncMock()
+
+        context = MagicMock(spec=CallbackContext)
+        context.args = ["Odesa"]
+
+        weather_cmd = WeatherCommandHandler()
+        weather_cmd.handle_weather_request = AsyncMock(return_value=None)
+        weather_cmd._append_clothing_advice = MagicMock()
+
+        asyncio.run(weather_cmd(update, context))
+
+        update.message.reply_text.assert_called_once_with("Не вдалося отримати дані про погоду. ")
+        weather_cmd._append_clothing_advice.assert_not_called()
+
+    def test_weather_api_caches_by_translated_city(self):
+        """Repeated lookups within the TTL reuse the cached response."""
+        import asyncio
+
+        response = MagicMock()
+        response.json.return_value = {
+            "cod": 200, "name": "Kyiv", "sys": {"country": "UA"},
+            "weather": [{"id": 800, "description": "ясно"}],
+            "main": {"temp": 20, "feels_like": 19},
+        }
+        api = WeatherAPI()
+        api.client.get = AsyncMock(return_value=response)
+
+        first = asyncio.run(api.fetch_weather("Kyiv"))
+        second = asyncio.run(api.fetch_weather("kyiv"))
+        self.assertIs(first, second)
+        self.assertEqual(api.client.get.await_count, 1)
+
+        # Expired entries are fetched again
+        api.cache["kyiv"] = (0.0, first)
+        with patch('modules.weather.time.monotonic', return_value=api.CACHE_TTL_SECONDS + 1.0):
+            asyncio.run(api.fetch_weather("Kyiv"))
+        self.assertEqual(api.client.get.await_count, 2)
+
 # Additional tests for core utilities
     def test_remove_links(self):
         """Test removing URLs from text."""
@@ -308,6 +383,12 @@ class TestBot(unittest.TestCase):
         self.assertEqual(get_feels_like_emoji(30), next(emoji for temp_range, emoji in feels_like_emojis.items() 
                                                if 30 in temp_range))
 
+    def test_escape_markdown_v2(self):
+        """Test MarkdownV2 escaping of Telegram's reserved characters."""
+        self.assertEqual(escape_markdown_v2("plain text"), "plain text")
+        self.assertEqual(escape_markdown_v2("v1.2 (beta)!"), "v1\\.2 \\(beta\\)\\!")
+        self.assertEqual(escape_markdown_v2("a_b*c\\d"), "a\\_b\\*c\\\\d")
+
     def test_get_city_translation(self):
         """Test city name translation."""
         # Test known city translations
@@ -318,6 +399,8 @@ class TestBot(unittest.TestCase):
         
         # Test with spaces
         self.assertEqual(get_city_translation("New York"), "New York")
+        self.assertEqual(get_city_translation("Тель Авів"), "Tel Aviv")
+        self.assertEqual(get_city_translation("тель\u00a0АВІВ"), "Tel Aviv")
         
         # Test unknown city (should return original)
         self.assertEqual(get_city_translation("Unknown City"), "Unknown City")
@@ -351,6 +434,20 @@ class TestBot(unittest.TestCase):
             self.assertTrue(mock_ensure_directory.called)
             self.assertEqual(len(mock_ensure_directory.call_args_list), 4)
 
+    def test_message_counter_is_bounded(self):
+        """Test that MessageCounter caps counts and evicts the least recently active chat."""
+        counter = MessageCounter()
+        counter.MAX_CHATS = 2
+        counter.MAX_COUNT = 3
+        for _ in range(5):
+            counter.increment(1)
+        self.assertEqual(counter.increment(1), 3)
+        counter.increment(2)
+        counter.increment(1)
+        counter.increment(3)
+        self.assertNotIn(2, counter.counts)
+        self.assertEqual(list(counter.counts), [1, 3])
+
     def test_weather_data_formatting(self):
         """Test weather data formatting and advice generation."""
         # Skip this async test for now
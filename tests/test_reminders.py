@@ -8,7 +8,7 @@ from telegram.ext import CallbackContext
 from telegram import Update, User, Chat, Message
 
 # Import the classes from the reminders module
-from modules.reminders.reminders import Reminder, ReminderManager, seconds_until, KYIV_TZ
+from modules.reminders.reminders import Reminder, ReminderManager, REMINDERS_SCHEMA, seconds_until, KYIV_TZ
 
 class TestReminder(unittest.TestCase):
     def setUp(self):
@@ -41,7 +41,7 @@ class TestReminder(unittest.TestCase):
         """Test converting a Reminder to a tuple for database storage."""
         expected_tuple = (
             1, "Test task", "daily", "in 1 hour", None, 
-            self.test_time.isoformat(), 123456, -100123456, "@test_user"
+            1744358280000000, 123456, -100123456, "@test_user"
         )
         self.assertEqual(self.reminder.to_tuple(), expected_tuple)
 
@@ -49,7 +49,7 @@ class TestReminder(unittest.TestCase):
         """Test creating a Reminder from a tuple from the database."""
         tuple_data = (
             1, "Test task", "daily", "in 1 hour", None, 
-            self.test_time.isoformat(), 123456, -100123456, "@test_user"
+            1744358280000000, 123456, -100123456, "@test_user"
         )
         reminder = Reminder.from_tuple(tuple_data)
         self.assertEqual(reminder.reminder_id, 1)
@@ -131,7 +131,55 @@ class TestReminder(unittest.TestCase):
         self.assertEqual(reminder.next_execution, expected_next)
 
 
+    def test_calculate_next_execution_daily_month_end(self):
+        """Daily reminders roll over month boundaries."""
+        now = datetime.datetime(2025, 2, 1, 9, 0, tzinfo=KYIV_TZ)
+
+        reminder = Reminder(
+            task="Daily task",
+            frequency="daily",
+            delay=None,
+            date_modifier=None,
+            next_execution=datetime.datetime(2025, 1, 31, 10, 0, tzinfo=KYIV_TZ),
+            user_id=123456,
+            chat_id=-100123456
+        )
+
+        # now is passed in, so no datetime patching is needed
+        reminder.calculate_next_execution(now)
+
+        self.assertEqual(reminder.next_execution, datetime.datetime(2025, 2, 1, 10, 0, tzinfo=KYIV_TZ))
+
+
         
+    def test_calculate_first_day_of_month_uses_local_offset(self):
+        """Month-boundary reminders get the real Kyiv offset, not pytz's LMT."""
+        reminder = Reminder(
+            task="First day task",
+            frequency="monthly",
+            delay=None,
+            date_modifier="first day of every month",
+            next_execution=None,
+            user_id=123456,
+            chat_id=-100123456
+        )
+
+        reminder._calc_first_month(datetime.datetime(2025, 4, 15, 9, 0, tzinfo=KYIV_TZ))
+
+        self.assertEqual(reminder.next_execution, KYIV_TZ.localize(datetime.datetime(2025, 5, 1, 9, 0)))
+        self.assertEqual(reminder.next_execution.utcoffset(), datetime.timedelta(hours=3))
+
+    def test_month_helpers_roll_over_december(self):
+        """December rolls into January of the following year."""
+        reminder = Reminder("Year end", "monthly", None, "last day of every month",
+                            KYIV_TZ.localize(datetime.datetime(2025, 12, 31, 18, 0)), 123456, -100123456)
+
+        reminder._calc_last_month(KYIV_TZ.localize(datetime.datetime(2025, 12, 31, 18, 0)))
+        self.assertEqual(reminder.next_execution, KYIV_TZ.localize(datetime.datetime(2026, 1, 31, 18, 0)))
+
+        reminder._calc_first_month(KYIV_TZ.localize(datetime.datetime(2025, 12, 10, 9, 0)))
+        self.assertEqual(reminder.next_execution, KYIV_TZ.localize(datetime.datetime(2026, 1, 1, 18, 0)))
+
     @patch('modules.reminders.reminders.datetime')
     def test_calculate_last_day_of_month(self, mock_datetime):
         """Test calculating the next execution for last day of month reminders."""
@@ -160,10 +208,10 @@ class TestReminder(unittest.TestCase):
 
 class TestReminderManager(unittest.TestCase):
     def setUp(self):
-        # Use in-memory SQLite database for testing
+        # A fresh in-memory database per test is cheap and keeps no state between tests
         self.db_file = ":memory:"
         self.manager = ReminderManager(db_file=self.db_file)
-        
+
         # Create a test reminder
         self.test_time = datetime.datetime(2025, 4, 11, 10, 0, tzinfo=KYIV_TZ)
         self.test_reminder = Reminder(
@@ -176,11 +224,11 @@ class TestReminderManager(unittest.TestCase):
             chat_id=-100123456,
             user_mention_md="@test_user"
         )
-        
+
     def tearDown(self):
         # Close the database connection
         self.manager.conn.close()
-        
+
     def test_save_and_load_reminder(self):
         """Test saving a reminder to the database and loading it back."""
         # Save the reminder
@@ -211,6 +259,84 @@ class TestReminderManager(unittest.TestCase):
         self.assertEqual(loaded_reminder.chat_id, -100123456)
         self.assertEqual(loaded_reminder.user_mention_md, "@test_user")
         
+    def test_save_many_assigns_ids(self):
+        """Bulk inserts get their own ids and are persisted in one call."""
+        existing = self.manager.save_reminder(self.test_reminder)
+        batch = [
+            Reminder(f"Task {i}", None, None, None, self.test_time, 123456, -100123456)
+            for i in range(50)
+        ]
+
+        self.manager.save_many(batch)
+
+        stored = {r.reminder_id: r.task for r in self.manager.load_reminders()}
+        self.assertEqual(len(stored), 51)
+        for rem in batch:
+            self.assertEqual(stored[rem.reminder_id], rem.task)
+        self.assertNotIn(existing.reminder_id, {rem.reminder_id for rem in batch})
+
+    def test_transaction_commits_once_and_rolls_back(self):
+        """Saves inside transaction() join it; an error undoes the whole block."""
+        with self.manager.transaction():
+            self.manager.save_reminder(self.test_reminder)
+            self.assertTrue(self.manager.conn.in_transaction)
+        self.assertFalse(self.manager.conn.in_transaction)
+
+        with self.assertRaises(RuntimeError):
+            with self.manager.transaction():
+                self.manager.conn.execute("DELETE FROM reminders")
+                raise RuntimeError("boom")
+        count = self.manager.conn.execute("SELECT COUNT(*) FROM reminders").fetchone()[0]
+        self.assertEqual(count, 1)
+
+    def test_legacy_text_schedule_is_migrated(self):
+        """ISO text next_execution from older databases is converted to epoch microseconds."""
+        conn = sqlite3.connect(":memory:")
+        conn.executescript('''
+            CREATE TABLE reminders (
+                reminder_id INTEGER PRIMARY KEY AUTOINCREMENT, task TEXT NOT NULL, frequency TEXT,
+                delay TEXT, date_modifier TEXT, next_execution TEXT, user_id INTEGER NOT NULL,
+                chat_id INTEGER NOT NULL, user_mention_md TEXT
+            );
+            INSERT INTO reminders VALUES (7, 'Old task', NULL, NULL, NULL,
+                                          '2025-04-11T10:00:00+03:00', 123456, -100123456, NULL);
+        ''')
+        manager = ReminderManager.__new__(ReminderManager)
+        manager.conn = conn
+        manager._create_table()
+
+        stored = conn.execute("SELECT typeof(next_execution) FROM reminders").fetchone()[0]
+        self.assertEqual(stored, "integer")
+        (loaded,) = manager.load_reminders()
+        self.assertEqual(loaded.reminder_id, 7)
+        self.assertEqual(loaded.next_execution, KYIV_TZ.localize(datetime.datetime(2025, 4, 11, 10, 0)))
+        conn.close()
+
+    def test_interrupted_migration_is_recovered(self):
+        """Rows stranded in reminders_legacy by an interrupted rebuild are copied back."""
+        conn = sqlite3.connect(":memory:", isolation_level=None)
+        conn.executescript('''
+            CREATE TABLE reminders_legacy (
+                reminder_id INTEGER PRIMARY KEY AUTOINCREMENT, task TEXT NOT NULL, frequency TEXT,
+                delay TEXT, date_modifier TEXT, next_execution TEXT, user_id INTEGER NOT NULL,
+                chat_id INTEGER NOT NULL, user_mention_md TEXT
+            );
+            INSERT INTO reminders_legacy VALUES (7, 'Old task', 'daily', NULL, NULL,
+                                                 '2025-04-11T10:00:00+03:00', 123456, -100123456, NULL);
+        ''')
+        for statement in REMINDERS_SCHEMA:
+            conn.execute(statement)
+        manager = ReminderManager.__new__(ReminderManager)
+        manager.conn = conn
+        manager._create_table()
+
+        (loaded,) = manager.load_reminders()
+        self.assertEqual((loaded.reminder_id, loaded.task), (7, 'Old task'))
+        self.assertEqual(loaded.next_execution, KYIV_TZ.localize(datetime.datetime(2025, 4, 11, 10, 0)))
+        leftover = conn.execute("SELECT name FROM sqlite_master WHERE name = 'reminders_legacy'").fetchone()
+        self.assertIsNone(leftover)
+        conn.close()
+
     def test_remove_reminder(self):
         """Test removing a reminder from the database."""
         # Save the reminder first
@@ -225,7 +351,20 @@ class TestReminderManager(unittest.TestCase):
             self.assertTrue(True)
         except Exception as e:
             self.fail(f"remove_reminder raised exception {e}")
-        
+
+    def test_remove_reminders_batch(self):
+        """Batch removal deletes only the given reminders, from DB and cache."""
+        batch = self.manager.save_many([
+            Reminder(f"Task {i}", None, None, None, self.test_time, 123456, -100123456)
+            for i in range(5)
+        ])
+
+        self.manager.remove_reminders(batch[:3])
+
+        remaining = {r.reminder_id for r in self.manager.load_reminders()}
+        self.assertEqual(remaining, {r.reminder_id for r in batch[3:]})
+        self.assertEqual({r.reminder_id for r in self.manager.reminders}, remaining)
+
     def test_extract_task_and_time(self):
         """Test extracting task and time expressions from reminder text."""
         # Test with daily frequency
@@ -4,6 +4,7 @@ import time
 import pytest
 
 from main import sanitize_url, shorten_url, _url_shortener_cache, _shortener_calls, _SHORTENER_MAX_CALLS_PER_MINUTE
+from modules.const import LinkModification
 
 class DummyShortener:
     def __init__(self, mapping=None):
@@ -88,4 +89,32 @@ async def test_shorten_url_rate_limit(monkeypatch):
     assert r1 == "s1"
     # second long URL should be rate limited (max 1 per minute)
     r2 = await main.shorten_url(long2)
-    assert r2 == long2
\ No newline at end of file
+    assert r2 == long2
+
+
+@pytest.mark.parametrize("url,expected,replaced", [
+    ("https://x.com/user/status/1", "https://fixupx.com/user/status/1", 1),
+    ("https://www.twitter.com/user", "https://www.fxtwitter.com/user", 1),
+    ("https://fixupx.com/user/status/1", "https://fixupx.com/user/status/1", 0),
+    ("https://netflix.com/title/1", "https://netflix.com/title/1", 0),
+])
+def test_domain_regex_replaces_whole_hosts_only(url, expected, replaced):
+    result, count = LinkModification.SOURCE_PATTERN.subn(lambda m: LinkModification.DOMAINS[m.group(0)], url, count=1)
+    assert (result, count) == (expected, replaced)
+
+
+@pytest.mark.asyncio
+async def test_process_urls_survives_failed_round_trips(monkeypatch):
+    from unittest.mock import AsyncMock, MagicMock
+    import main
+    long_link = "https://www.aliexpress.com/item/" + "1" * 120
+    monkeypatch.setattr(main, 'shorten_url', AsyncMock(side_effect=RuntimeError("shortener down")))
+    send = AsyncMock()
+    monkeypatch.setattr(main, 'construct_and_send_message', send)
+    update = MagicMock()
+    update.effective_chat.id = 1
+    context = MagicMock()
+    context.bot.send_sticker = AsyncMock(side_effect=RuntimeError("flood wait"))
+    await main.process_urls(update, context, [long_link], long_link)
+    # Failed shortening falls back to the sanitized link and the reply is still sent
+    assert send.await_args.args[3] == [long_link + " #aliexpress"]
@@ -1,9 +1,4 @@
 import unittest
-import os
-import sys
-
-# Add the project root to the Python path so we can import modules
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from modules.utils import extract_urls
 